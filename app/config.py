@@ -6,6 +6,7 @@
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List
 
 from dotenv import load_dotenv
@@ -173,21 +174,32 @@ def reload_config() -> AppConfig:
     return _config
 
 
+# 고정 Redis Key
+ORG_LIMITS_HASH_KEY = "org_limits"
+GLOBAL_TOTAL_KEY = "global:total_running"
+
+# Organization 기반 Key 캐시 크기 (org 이름은 반복되므로 f-string 결과를 재사용)
+_KEY_CACHE_SIZE = 2048
+
+
 # Redis Key 생성 헬퍼 함수
 class RedisKeys:
     """Redis Key 생성 헬퍼"""
     
     @staticmethod
+    @lru_cache(maxsize=_KEY_CACHE_SIZE)
     def org_running(org_name: str) -> str:
         """Organization의 현재 실행 중인 Runner 수 키"""
         return f"org:{org_name}:running"
     
     @staticmethod
+    @lru_cache(maxsize=_KEY_CACHE_SIZE)
     def org_pending(org_name: str) -> str:
         """Organization의 대기 중인 Job 목록 키"""
         return f"org:{org_name}:pending"
     
     @staticmethod
+    @lru_cache(maxsize=_KEY_CACHE_SIZE)
     def org_max_limit(org_name: str) -> str:
         """Organization의 커스텀 최대 Runner 수 키"""
         return f"org:{org_name}:max_limit"
@@ -195,12 +207,12 @@ class RedisKeys:
     @staticmethod
     def org_limits_hash() -> str:
         """모든 Organization 커스텀 제한을 저장하는 Hash 키"""
-        return "org_limits"
+        return ORG_LIMITS_HASH_KEY
     
     @staticmethod
     def global_total() -> str:
         """전체 실행 중인 Runner 수 키"""
-        return "global:total_running"
+        return GLOBAL_TOTAL_KEY
     
     @staticmethod
     def job_info(job_id: int) -> str:
@@ -6,6 +6,7 @@ Runner 상태 관리 및 메시지 큐 연동
 
 import json
 import logging
+import re
 import time
 from typing import Dict, List, Optional, Any, Tuple
 
@@ -16,17 +17,70 @@ from app.config import get_config, RedisKeys
 
 logger = logging.getLogger(__name__)
 
+# 대기열 키 SCAN 시 한 번에 조회할 키 수 힌트 (기본 COUNT=10은 round-trip이 과다)
+PENDING_SCAN_COUNT = 1000
+
+# 직렬화된 pending job에서 job_id만 추출 (전체 JSON 파싱 회피)
+_JOB_ID_PATTERN = re.compile(rb'"job_id"\s*:\s*(\d+)')
+
+# save_runner_info가 저장하는 Runner 정보 필드 (HMGET 순서)
+_RUNNER_FIELDS = ("runner_name", "org_name", "job_id", "run_id", "repo_full_name")
+
+# 대기열에서 지정된 항목들을 서버 측에서 원자적으로 제거 (LREM)
+# DEL + RPUSH 재구성과 달리 그 사이에 추가된 Job을 잃지 않음
+_REMOVE_PENDING_JOBS_LUA = """
+local removed = 0
+for i = 1, #ARGV do
+    removed = removed + redis.call('LREM', KEYS[1], 1, ARGV[i])
+end
+return removed
+"""
+
 # 글로벌 클라이언트 인스턴스
 _async_client: Optional[aioredis.Redis] = None
 _sync_client: Optional[redis.Redis] = None
 
 
+def _serialize_pending_job(
+    org_name: str,
+    job_id: int,
+    run_id: int,
+    job_name: str,
+    repo_full_name: str,
+    labels: List[str],
+    timestamp: float
+) -> str:
+    """대기열에 저장할 pending job JSON 직렬화 (단건/일괄 추가가 같은 형식을 사용)"""
+    return json.dumps({
+        "job_id": job_id,
+        "run_id": run_id,
+        "job_name": job_name,
+        "repo_full_name": repo_full_name,
+        "labels": labels,
+        "org_name": org_name,
+        "timestamp": timestamp
+    })
+
+
+def _runner_info_from_values(values: List[Any]) -> Optional[Dict]:
+    """HMGET 결과(_RUNNER_FIELDS 순서)를 Runner 정보 dict로 변환"""
+    if not any(values):
+        return None
+    return {
+        field: value.decode() if isinstance(value, bytes) else value
+        for field, value in zip(_RUNNER_FIELDS, values, strict=True)
+        if value is not None
+    }
+
+
 class RedisClient:
     """비동기 Redis 클라이언트"""
     
     def __init__(self, client: aioredis.Redis):
         self.client = client
         self.config = get_config()
+        # Org 기본 제한 (커스텀 제한이 없을 때 사용)
+        self._default_limit = self.config.runner.max_per_org
     
     async def ping(self) -> bool:
         """Redis 연결 확인"""
@@ -111,7 +165,7 @@ class RedisClient:
         custom_limit = await self.get_org_max_limit(org_name)
         if custom_limit is not None:
             return custom_limit
-        return self.config.runner.max_per_org
+        return self._default_limit
     
     # ==================== 전체 카운트 관련 ====================
     
@@ -153,17 +207,37 @@ class RedisClient:
     ) -> None:
         """대기열에 Job 추가 (전체 정보 포함, timestamp 포함)"""
         key = RedisKeys.org_pending(org_name)
-        job_data = json.dumps({
-            "job_id": job_id,
-            "run_id": run_id,
-            "job_name": job_name,
-            "repo_full_name": repo_full_name,
-            "labels": labels,
-            "org_name": org_name,
-            "timestamp": time.time()
-        })
+        job_data = _serialize_pending_job(
+            org_name, job_id, run_id, job_name, repo_full_name, labels, time.time()
+        )
         await self.client.rpush(key, job_data)
     
+    async def add_pending_jobs(self, jobs: List[Dict[str, Any]]) -> None:
+        """
+        대기열에 여러 Job 일괄 추가
+        
+        timestamp는 한 번만 계산하고, RPUSH는 pipeline으로 한 번에 전송합니다.
+        
+        Args:
+            jobs: org_name, job_id, run_id, job_name, repo_full_name, labels를 포함한 dict 목록
+        """
+        if not jobs:
+            return
+        timestamp = time.time()
+        pipe = self.client.pipeline(transaction=False)
+        for job in jobs:
+            job_data = _serialize_pending_job(
+                job["org_name"],
+                job["job_id"],
+                job["run_id"],
+                job["job_name"],
+                job["repo_full_name"],
+                job["labels"],
+                timestamp
+            )
+            pipe.rpush(RedisKeys.org_pending(job["org_name"]), job_data)
+        await pipe.execute()
+    
     async def pop_pending_job(self, org_name: str) -> Optional[Dict]:
         """대기열에서 Job 가져오기 (FIFO)"""
         key = RedisKeys.org_pending(org_name)
@@ -197,18 +271,17 @@ class RedisClient:
             "run_id": run_id,
             "repo_full_name": repo_full_name
         }
-        await self.client.hset(key, mapping=data)
-        await self.client.expire(key, self.config.redis.ttl)
+        # HSET + EXPIRE를 한 번의 round-trip으로 전송
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hset(key, mapping=data)
+        pipe.expire(key, self.config.redis.ttl)
+        await pipe.execute()
     
     async def get_runner_info(self, runner_name: str) -> Optional[Dict]:
         """Runner 정보 조회"""
         key = RedisKeys.runner_info(runner_name)
-        data = await self.client.hgetall(key)
-        if data:
-            return {k.decode() if isinstance(k, bytes) else k: 
-                    v.decode() if isinstance(v, bytes) else v 
-                    for k, v in data.items()}
-        return None
+        values = await self.client.hmget(key, *_RUNNER_FIELDS)
+        return _runner_info_from_values(values)
     
     async def delete_runner_info(self, runner_name: str) -> None:
         """Runner 정보 삭제"""
@@ -249,6 +322,10 @@ class RedisClientSync:
     def __init__(self, client: redis.Redis):
         self.client = client
         self.config = get_config()
+        # Org 기본 제한 (커스텀 제한이 없을 때 사용)
+        self._default_limit = self.config.runner.max_per_org
+        # EVALSHA로 실행 (스크립트 미등록 시 자동으로 EVAL fallback)
+        self._remove_pending_jobs_script = client.register_script(_REMOVE_PENDING_JOBS_LUA)
     
     def ping(self) -> bool:
         return self.client.ping()
@@ -322,7 +399,7 @@ class RedisClientSync:
         custom_limit = self.get_org_max_limit_sync(org_name)
         if custom_limit is not None:
             return custom_limit
-        return self.config.runner.max_per_org
+        return self._default_limit
     
     # ==================== 전체 카운트 관련 ====================
     
@@ -360,15 +437,9 @@ class RedisClientSync:
     ) -> None:
         """대기열에 Job 추가 (전체 정보 포함, timestamp 포함)"""
         key = RedisKeys.org_pending(org_name)
-        job_data = json.dumps({
-            "job_id": job_id,
-            "run_id": run_id,
-            "job_name": job_name,
-            "repo_full_name": repo_full_name,
-            "labels": labels,
-            "org_name": org_name,
-            "timestamp": time.time()
-        })
+        job_data = _serialize_pending_job(
+            org_name, job_id, run_id, job_name, repo_full_name, labels, time.time()
+        )
         self.client.rpush(key, job_data)
     
     def pop_pending_job_sync(self, org_name: str) -> Optional[Dict]:
@@ -403,17 +474,16 @@ class RedisClientSync:
             "run_id": str(run_id),
             "repo_full_name": repo_full_name
         }
-        self.client.hset(key, mapping=data)
-        self.client.expire(key, self.config.redis.ttl)
+        # HSET + EXPIRE를 한 번의 round-trip으로 전송
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hset(key, mapping=data)
+        pipe.expire(key, self.config.redis.ttl)
+        pipe.execute()
     
     def get_runner_info_sync(self, runner_name: str) -> Optional[Dict]:
         key = RedisKeys.runner_info(runner_name)
-        data = self.client.hgetall(key)
-        if data:
-            return {k.decode() if isinstance(k, bytes) else k:
-                    v.decode() if isinstance(v, bytes) else v
-                    for k, v in data.items()}
-        return None
+        values = self.client.hmget(key, *_RUNNER_FIELDS)
+        return _runner_info_from_values(values)
     
     def delete_runner_info_sync(self, runner_name: str) -> None:
         key = RedisKeys.runner_info(runner_name)
@@ -432,17 +502,20 @@ class RedisClientSync:
     
     # ==================== 배치 대기열 처리 관련 ====================
     
-    def peek_all_pending_jobs_sync(self) -> List[Tuple[str, int, Dict]]:
+    def peek_all_pending_jobs_sync(self, count: int = PENDING_SCAN_COUNT) -> List[Tuple[str, int, Dict]]:
         """
         모든 Org의 pending job을 조회 (제거하지 않고)
         
+        Args:
+            count: SCAN 한 번에 조회할 키 수 힌트
+        
         Returns:
             List of (org_name, index, job_data) sorted by timestamp (FIFO)
         """
         all_jobs = []
         pattern = "org:*:pending"
         
-        for key in self.client.scan_iter(match=pattern):
+        for key in self.client.scan_iter(match=pattern, count=count):
             key_str = key.decode() if isinstance(key, bytes) else key
             parts = key_str.split(":")
             if len(parts) >= 2:
@@ -489,24 +562,29 @@ class RedisClientSync:
             # 제거할 job_id set
             job_ids_set = set(job_ids)
             
-            # 유지할 항목들
-            items_to_keep = []
-            for item in items:
-                data = item.decode() if isinstance(item, bytes) else item
-                job_data = json.loads(data)
-                if job_data.get("job_id") not in job_ids_set:
-                    items_to_keep.append(item)
-                else:
-                    removed_count += 1
+            # 제거할 항목들
+            items_to_remove = [
+                item for item in items
+                if self._extract_job_id(item) in job_ids_set
+            ]
+            if not items_to_remove:
+                continue
             
-            # Queue 재구성 (atomic operation을 위해 pipeline 사용)
-            pipe = self.client.pipeline()
-            pipe.delete(key)
-            if items_to_keep:
-                pipe.rpush(key, *items_to_keep)
-            pipe.execute()
+            # 단일 round-trip으로 원자적 제거
+            removed_count += self._remove_pending_jobs_script(
+                keys=[key], args=items_to_remove
+            )
         
         return removed_count
+    
+    @staticmethod
+    def _extract_job_id(item: Any) -> Any:
+        """직렬화된 job에서 job_id 추출 (정수 job_id는 JSON 파싱 없이 처리)"""
+        raw = item if isinstance(item, bytes) else item.encode()
+        match = _JOB_ID_PATTERN.search(raw)
+        if match:
+            return int(match.group(1))
+        return json.loads(raw).get("job_id")
 
 
 def get_redis_client() -> RedisClient:
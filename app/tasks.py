@@ -9,10 +9,11 @@ from typing import List, Optional, Dict
 
 from celery import shared_task
 from celery.exceptions import MaxRetriesExceededError
+from celery.utils.time import get_exponential_backoff_interval
 
 from app.celery_app import celery_app
 from app.config import get_config, RedisKeys
-from app.redis_client import get_redis_client_sync
+from app.redis_client import get_redis_client_sync, PENDING_SCAN_COUNT
 from app.github_client import GitHubClient
 from app.k8s_client import KubernetesClient
 
@@ -23,7 +24,30 @@ logger = logging.getLogger(__name__)
 # Runner 생성 태스크
 # =============================================================================
 
-@celery_app.task(bind=True, max_retries=3, default_retry_delay=30)
+def _retry_countdown(task) -> int:
+    """
+    재시도 대기 시간 계산 (지수 백오프 + jitter)
+    
+    self.retry()를 직접 호출하므로 task의 retry_backoff 설정을 countdown으로 변환합니다.
+    jitter로 대기 시간이 0에 가까워지지 않도록 default_retry_delay를 하한으로 둡니다.
+    """
+    interval = get_exponential_backoff_interval(
+        factor=int(task.retry_backoff),
+        retries=task.request.retries,
+        maximum=task.retry_backoff_max,
+        full_jitter=task.retry_jitter
+    )
+    return max(task.default_retry_delay, interval)
+
+
+@celery_app.task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=30,
+    retry_backoff=30,
+    retry_backoff_max=600,
+    retry_jitter=True
+)
 def create_runner_for_job(
     self,
     org_name: str,
@@ -65,7 +89,7 @@ def create_runner_for_job(
             )
         except Exception as e:
             logger.error(f"JIT Runner 토큰 발급 실패: {e}")
-            raise self.retry(exc=e)
+            raise self.retry(exc=e, countdown=_retry_countdown(self))
         
         # 2. Kubernetes Pod 생성
         logger.info(f"Runner Pod 생성 중: name={runner_name}")
@@ -80,7 +104,7 @@ def create_runner_for_job(
             )
         except Exception as e:
             logger.error(f"Runner Pod 생성 실패: {e}")
-            raise self.retry(exc=e)
+            raise self.retry(exc=e, countdown=_retry_countdown(self))
         
         # 3. Redis 상태 업데이트
         redis_client.increment_org_running_sync(org_name)
@@ -308,7 +332,7 @@ def _get_orgs_with_pending_jobs(redis_client) -> List[str]:
     try:
         # org:*:pending 패턴으로 대기열 키 검색
         pattern = "org:*:pending"
-        for key in redis_client.client.scan_iter(match=pattern):
+        for key in redis_client.client.scan_iter(match=pattern, count=PENDING_SCAN_COUNT):
             key_str = key.decode() if isinstance(key, bytes) else key
             # org:{name}:pending 에서 name 추출
             parts = key_str.split(":")
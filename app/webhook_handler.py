@@ -4,17 +4,16 @@ GitHub Webhook 핸들러
 Enterprise Webhook을 수신하고 처리합니다.
 """
 
-import hashlib
 import hmac
 import json
 import logging
-from typing import Optional
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Request, HTTPException, Header
+from fastapi import APIRouter, Request, HTTPException, Header, Depends
 from pydantic import BaseModel
 
 from app.config import get_config
-from app.redis_client import get_redis_client
+from app.redis_client import get_redis_client, RedisClient
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -44,18 +43,30 @@ def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> boo
     if not signature or not signature.startswith("sha256="):
         return False
     
-    expected_signature = "sha256=" + hmac.new(
+    # hmac.digest: OpenSSL one-shot HMAC (HMAC 객체 생성 없음)
+    expected_signature = "sha256=" + hmac.digest(
         secret.encode("utf-8"),
         payload,
-        hashlib.sha256
-    ).hexdigest()
+        "sha256"
+    ).hex()
     
     return hmac.compare_digest(signature, expected_signature)
 
 
+async def redis_client_dependency() -> RedisClient:
+    """
+    Webhook 핸들러용 Redis 클라이언트 의존성
+
+    async 의존성이므로 threadpool을 거치지 않고 이벤트 루프에서 해석되어,
+    전역 클라이언트 지연 생성이 동시 요청 간에 경합하지 않습니다.
+    """
+    return get_redis_client()
+
+
 @router.post("")
 async def handle_webhook(
     request: Request,
+    redis_client: Annotated[RedisClient, Depends(redis_client_dependency)],
     x_github_event: str = Header(None, alias="X-GitHub-Event"),
     x_hub_signature_256: str = Header(None, alias="X-Hub-Signature-256"),
     x_github_delivery: str = Header(None, alias="X-GitHub-Delivery")
@@ -127,7 +138,6 @@ async def handle_webhook(
         # Redis 대기열에 Job 저장 (모든 요청은 일단 대기열로)
         logger.info(f"Job 대기열 추가: org={org_name}, job_id={job_id}")
         
-        redis_client = get_redis_client()
         await redis_client.add_pending_job(
             org_name=org_name,
             job_id=job_id,
@@ -320,7 +320,7 @@ async def list_workflow_runs(
 
 @app.post("/test/reset")
 async def reset_storage():
-    """테스트용 상태 초기화"""
+    """테스트용 상태 초기화 (API 호출 기록 포함)"""
     storage.reset()
     return {"status": "ok", "message": "Storage reset"}
 
@@ -52,6 +52,11 @@ kubectl create namespace jit-runners --context "kind-${CLUSTER_NAME}" || true
 echo "RBAC 설정 적용 중..."
 kubectl apply -f "${PROJECT_ROOT}/k8s/rbac.yaml" --context "kind-${CLUSTER_NAME}" || true
 
+# 통합 테스트 Pod 이미지 사전 적재
+echo "테스트 이미지(busybox:latest) 적재 중..."
+docker pull busybox:latest && \
+kind load docker-image busybox:latest --name "${CLUSTER_NAME}" || true
+
 # 클러스터 상태 확인
 echo ""
 echo "=========================================="
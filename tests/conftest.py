@@ -92,6 +92,7 @@ def mock_redis_client():
     mock_client.hget = AsyncMock(return_value=None)
     mock_client.hset = AsyncMock(return_value=1)
     mock_client.hgetall = AsyncMock(return_value={})
+    mock_client.hmget = AsyncMock(return_value=[None] * 5)
     mock_client.hdel = AsyncMock(return_value=1)
     mock_client.llen = AsyncMock(return_value=0)
     mock_client.rpush = AsyncMock(return_value=1)
@@ -101,6 +102,11 @@ def mock_redis_client():
     mock_client.expire = AsyncMock(return_value=True)
     mock_client.scan_iter = MagicMock(return_value=iter([]))
     
+    # pipeline()은 동기 호출, execute()만 코루틴
+    mock_pipe = MagicMock()
+    mock_pipe.execute = AsyncMock(return_value=[])
+    mock_client.pipeline = MagicMock(return_value=mock_pipe)
+    
     return mock_client
 
 
@@ -116,6 +122,7 @@ def mock_redis_client_sync():
     mock_client.hget = MagicMock(return_value=None)
     mock_client.hset = MagicMock(return_value=1)
     mock_client.hgetall = MagicMock(return_value={})
+    mock_client.hmget = MagicMock(return_value=[None] * 5)
     mock_client.hdel = MagicMock(return_value=1)
     mock_client.llen = MagicMock(return_value=0)
     mock_client.rpush = MagicMock(return_value=1)
@@ -124,7 +131,9 @@ def mock_redis_client_sync():
     mock_client.delete = MagicMock(return_value=1)
     mock_client.expire = MagicMock(return_value=True)
     mock_client.scan_iter = MagicMock(return_value=iter([]))
-    mock_client.pipeline = MagicMock()
+    mock_pipe = MagicMock()
+    mock_client.pipeline = MagicMock(return_value=mock_pipe)
+    mock_client.register_script = MagicMock(return_value=MagicMock(return_value=0))
     
     return mock_client
 
@@ -133,9 +142,8 @@ def mock_redis_client_sync():
 # GitHub Fixtures
 # =============================================================================
 
-@pytest.fixture
-def sample_workflow_job_payload():
-    """샘플 Workflow Job 페이로드"""
+def _sample_workflow_job_payload() -> Dict[str, Any]:
+    """샘플 Workflow Job 페이로드 생성 (호출마다 새 dict)"""
     return {
         "action": "queued",
         "workflow_job": {
@@ -164,6 +172,25 @@ def sample_workflow_job_payload():
     }
 
 
+@pytest.fixture
+def sample_workflow_job_payload():
+    """샘플 Workflow Job 페이로드"""
+    return _sample_workflow_job_payload()
+
+
+@pytest.fixture(scope="session")
+def signed_workflow_job():
+    """서명된 샘플 Workflow Job 요청 (payload bytes, headers) - 세션당 한 번 계산"""
+    payload_bytes = json.dumps(_sample_workflow_job_payload(), separators=(",", ":")).encode()
+    headers = {
+        "X-GitHub-Event": "workflow_job",
+        "X-GitHub-Delivery": "test-delivery-123",
+        "X-Hub-Signature-256": calculate_webhook_signature(payload_bytes, "test-webhook-secret"),
+        "Content-Type": "application/json"
+    }
+    return payload_bytes, headers
+
+
 @pytest.fixture
 def sample_jit_config():
     """샘플 JIT Runner 설정"""
@@ -233,6 +260,21 @@ def test_client():
         yield client
 
 
+@pytest.fixture(scope="session")
+def app_client_no_lifespan():
+    """세션 공유 FastAPI 테스트 클라이언트
+    
+    context에 진입하지 않으므로 lifespan(Redis ping, org limits 초기화)은 실행되지 않음
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    
+    client = TestClient(app)
+    yield client
+    client.close()
+
+
 # =============================================================================
 # Webhook Fixtures
 # =============================================================================
@@ -250,14 +292,13 @@ def webhook_headers():
 
 def calculate_webhook_signature(payload: bytes, secret: str) -> str:
     """Webhook 서명 계산 헬퍼"""
-    import hashlib
     import hmac
     
-    signature = "sha256=" + hmac.new(
+    signature = "sha256=" + hmac.digest(
         secret.encode("utf-8"),
         payload,
-        hashlib.sha256
-    ).hexdigest()
+        "sha256"
+    ).hex()
     return signature
 
 
@@ -8,7 +8,7 @@ import json
 import time
 import asyncio
 import pytest
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import MagicMock, AsyncMock
 
 
 def run_async(coro):
@@ -180,6 +180,30 @@ class TestRedisClient:
         assert job_data["org_name"] == "test-org"
         assert "timestamp" in job_data
     
+    def test_add_pending_jobs_batch(self, redis_client, mock_redis_client):
+        """대기열에 여러 Job 일괄 추가 - 단일 pipeline execute"""
+        jobs = [
+            {
+                "org_name": org,
+                "job_id": job_id,
+                "run_id": 67890,
+                "job_name": "build",
+                "repo_full_name": f"{org}/test-repo",
+                "labels": ["code-linux"]
+            }
+            for org, job_id in [("test-org", 1), ("test-org", 2), ("other-org", 3)]
+        ]
+        
+        run_async(redis_client.add_pending_jobs(jobs))
+        
+        mock_pipe = mock_redis_client.pipeline.return_value
+        mock_pipe.execute.assert_called_once()
+        assert mock_pipe.rpush.call_count == 3
+        keys = [call[0][0] for call in mock_pipe.rpush.call_args_list]
+        assert keys == ["org:test-org:pending", "org:test-org:pending", "org:other-org:pending"]
+        timestamps = {json.loads(call[0][1])["timestamp"] for call in mock_pipe.rpush.call_args_list}
+        assert len(timestamps) == 1
+    
     def test_pop_pending_job_returns_none_when_empty(self, redis_client, mock_redis_client):
         """대기열에서 Job 가져오기 - 빈 경우"""
         mock_redis_client.lpop = AsyncMock(return_value=None)
@@ -209,9 +233,6 @@ class TestRedisClient:
     
     def test_save_runner_info(self, redis_client, mock_redis_client):
         """Runner 정보 저장"""
-        mock_redis_client.hset = AsyncMock()
-        mock_redis_client.expire = AsyncMock()
-        
         run_async(redis_client.save_runner_info(
             runner_name="jit-runner-12345",
             org_name="test-org",
@@ -220,12 +241,14 @@ class TestRedisClient:
             repo_full_name="test-org/test-repo"
         ))
         
-        mock_redis_client.hset.assert_called_once()
-        mock_redis_client.expire.assert_called_once()
+        mock_pipe = mock_redis_client.pipeline.return_value
+        mock_pipe.hset.assert_called_once()
+        mock_pipe.expire.assert_called_once()
+        mock_pipe.execute.assert_called_once()
     
     def test_get_runner_info_returns_none_when_empty(self, redis_client, mock_redis_client):
         """Runner 정보 조회 - 없을 때"""
-        mock_redis_client.hgetall = AsyncMock(return_value={})
+        mock_redis_client.hmget = AsyncMock(return_value=[None] * 5)
         
         info = run_async(redis_client.get_runner_info("jit-runner-12345"))
         
@@ -233,15 +256,16 @@ class TestRedisClient:
     
     def test_get_runner_info_returns_data(self, redis_client, mock_redis_client):
         """Runner 정보 조회"""
-        mock_redis_client.hgetall = AsyncMock(return_value={
-            b"runner_name": b"jit-runner-12345",
-            b"org_name": b"test-org"
-        })
+        mock_redis_client.hmget = AsyncMock(return_value=[
+            b"jit-runner-12345", b"test-org", b"12345", b"67890", b"test-org/test-repo"
+        ])
         
         info = run_async(redis_client.get_runner_info("jit-runner-12345"))
         
         assert info["runner_name"] == "jit-runner-12345"
         assert info["org_name"] == "test-org"
+        assert info["job_id"] == "12345"
+        assert info["repo_full_name"] == "test-org/test-repo"
     
     def test_delete_runner_info(self, redis_client, mock_redis_client):
         """Runner 정보 삭제"""
@@ -333,9 +357,40 @@ class TestRedisClientSync:
             repo_full_name="test-org/test-repo"
         )
         
-        mock_redis_client_sync.hset.assert_called_once()
-        mock_redis_client_sync.expire.assert_called_once()
-    
+        mock_pipe = mock_redis_client_sync.pipeline.return_value
+        mock_pipe.hset.assert_called_once()
+        mock_pipe.expire.assert_called_once()
+        mock_pipe.execute.assert_called_once()
+
+    def test_get_runner_info_sync_returns_data(self, redis_client_sync, mock_redis_client_sync):
+        """Runner 정보 동기 조회 (HMGET 한 번)"""
+        mock_redis_client_sync.hmget = MagicMock(return_value=[
+            b"jit-runner-12345", b"test-org", b"12345", b"67890", b"test-org/test-repo"
+        ])
+
+        info = redis_client_sync.get_runner_info_sync("jit-runner-12345")
+
+        mock_redis_client_sync.hmget.assert_called_once_with(
+            "runner:jit-runner-12345:info",
+            "runner_name", "org_name", "job_id", "run_id", "repo_full_name"
+        )
+        assert info == {
+            "runner_name": "jit-runner-12345",
+            "org_name": "test-org",
+            "job_id": "12345",
+            "run_id": "67890",
+            "repo_full_name": "test-org/test-repo"
+        }
+
+    def test_get_runner_info_sync_returns_none_when_empty(self, redis_client_sync, mock_redis_client_sync):
+        """Runner 정보 동기 조회 - 필드가 하나도 없을 때"""
+        mock_redis_client_sync.hmget = MagicMock(return_value=[None] * 5)
+
+        info = redis_client_sync.get_runner_info_sync("jit-runner-12345")
+
+        mock_redis_client_sync.hmget.assert_called_once()
+        assert info is None
+
     def test_peek_all_pending_jobs_sync(self, redis_client_sync, mock_redis_client_sync):
         """모든 pending job 조회 (제거 없이)"""
         # scan_iter가 키 목록 반환
@@ -349,11 +404,16 @@ class TestRedisClientSync:
         })
         mock_redis_client_sync.lrange.return_value = [job_data.encode()]
         
+        from app.redis_client import PENDING_SCAN_COUNT
+        
         jobs = redis_client_sync.peek_all_pending_jobs_sync()
         
         assert len(jobs) == 1
         assert jobs[0][0] == "test-org"
         assert jobs[0][2]["job_id"] == 12345
+        mock_redis_client_sync.scan_iter.assert_called_once_with(
+            match="org:*:pending", count=PENDING_SCAN_COUNT
+        )
     
     def test_remove_pending_jobs_by_job_ids_sync(self, redis_client_sync, mock_redis_client_sync):
         """특정 job_id의 pending job 제거"""
@@ -364,51 +424,72 @@ class TestRedisClientSync:
         ]
         mock_redis_client_sync.lrange.return_value = jobs_in_queue
         
-        # pipeline mock 설정
-        mock_pipe = MagicMock()
-        mock_redis_client_sync.pipeline.return_value = mock_pipe
+        mock_script = mock_redis_client_sync.register_script.return_value
+        mock_script.return_value = 1
         
         jobs_to_remove = [{"job_id": 12345, "org_name": "test-org"}]
         removed = redis_client_sync.remove_pending_jobs_by_job_ids_sync(jobs_to_remove)
         
         assert removed == 1
-        mock_pipe.delete.assert_called_once()
-        mock_pipe.rpush.assert_called_once()
+        mock_script.assert_called_once_with(
+            keys=["org:test-org:pending"], args=[jobs_in_queue[0]]
+        )
+        mock_redis_client_sync.delete.assert_not_called()
+    
+    def test_remove_pending_jobs_by_job_ids_sync_str_items(self, redis_client_sync, mock_redis_client_sync):
+        """str 항목 및 정수가 아닌 job_id도 제거 대상 비교"""
+        jobs_in_queue = [
+            json.dumps({"job_id": 12345, "org_name": "test-org"}),
+            json.dumps({"job_id": "legacy-1", "org_name": "test-org"}),
+            json.dumps({"job_id": 12346, "org_name": "test-org"}),
+        ]
+        mock_redis_client_sync.lrange.return_value = jobs_in_queue
+        mock_script = mock_redis_client_sync.register_script.return_value
+        mock_script.return_value = 2
+        
+        jobs_to_remove = [
+            {"job_id": 12345, "org_name": "test-org"},
+            {"job_id": "legacy-1", "org_name": "test-org"},
+        ]
+        removed = redis_client_sync.remove_pending_jobs_by_job_ids_sync(jobs_to_remove)
+        
+        assert removed == 2
+        mock_script.assert_called_once_with(
+            keys=["org:test-org:pending"], args=jobs_in_queue[:2]
+        )
 
 
 class TestRedisClientFactory:
     """Redis 클라이언트 팩토리 함수 테스트"""
     
-    def test_get_redis_client_creates_client(self, app_config):
+    @pytest.fixture(autouse=True)
+    def redis_module(self, monkeypatch):
+        """싱글톤 리셋 후 redis_client 모듈 반환"""
+        import app.redis_client as redis_module
+        monkeypatch.setattr(redis_module, "_async_client", None)
+        monkeypatch.setattr(redis_module, "_sync_client", None)
+        yield redis_module
+    
+    def test_get_redis_client_creates_client(self, app_config, redis_module, monkeypatch):
         """get_redis_client가 클라이언트 생성"""
-        with patch("app.redis_client.aioredis") as mock_aioredis:
-            mock_client = AsyncMock()
-            mock_aioredis.from_url.return_value = mock_client
-            
-            # 싱글톤 리셋
-            import app.redis_client as redis_module
-            redis_module._async_client = None
-            
-            from app.redis_client import get_redis_client
-            
-            client = get_redis_client()
-            
-            assert client is not None
-            mock_aioredis.from_url.assert_called_once()
-    
-    def test_get_redis_client_sync_creates_client(self, app_config):
+        mock_from_url = MagicMock(return_value=AsyncMock())
+        monkeypatch.setattr(redis_module.aioredis, "from_url", mock_from_url)
+        
+        client = redis_module.get_redis_client()
+        
+        assert client is not None
+        mock_from_url.assert_called_once()
+        # 파서는 redis-py가 선택 (hiredis 설치 시 자동 사용)
+        assert "parser_class" not in mock_from_url.call_args.kwargs
+    
+    def test_get_redis_client_sync_creates_client(self, app_config, redis_module, monkeypatch):
         """get_redis_client_sync가 클라이언트 생성"""
-        with patch("app.redis_client.redis") as mock_redis:
-            mock_client = MagicMock()
-            mock_redis.from_url.return_value = mock_client
-            
-            # 싱글톤 리셋
-            import app.redis_client as redis_module
-            redis_module._sync_client = None
-            
-            from app.redis_client import get_redis_client_sync
-            
-            client = get_redis_client_sync()
-            
-            assert client is not None
-            mock_redis.from_url.assert_called_once()
+        mock_from_url = MagicMock(return_value=MagicMock())
+        monkeypatch.setattr(redis_module.redis, "from_url", mock_from_url)
+        
+        client = redis_module.get_redis_client_sync()
+        
+        assert client is not None
+        mock_from_url.assert_called_once()
+        # 파서는 redis-py가 선택 (hiredis 설치 시 자동 사용)
+        assert "parser_class" not in mock_from_url.call_args.kwargs
@@ -5,7 +5,40 @@ app/tasks.py의 Celery 태스크 테스트
 """
 
 import pytest
-from unittest.mock import MagicMock, patch, PropertyMock
+from dataclasses import dataclass, asdict
+from types import SimpleNamespace as NS
+from unittest.mock import DEFAULT, MagicMock, patch, PropertyMock
+
+from app.tasks import (
+    create_runner_for_job,
+    process_pending_queues,
+    cleanup_stale_runners,
+    sync_redis_state,
+    _sync_running_state,
+    _get_orgs_with_pending_jobs,
+    _retry_countdown,
+)
+from app.redis_client import PENDING_SCAN_COUNT
+
+
+@dataclass(slots=True, frozen=True)
+class PendingJob:
+    """peek_all_pending_jobs_sync가 반환하는 pending job 데이터"""
+    job_id: int
+    org_name: str
+    run_id: int
+    job_name: str
+    repo_full_name: str
+    labels: list
+    timestamp: float
+
+
+def make_jobs(org: str, n: int, labels: tuple = ()) -> list:
+    """(org_name, index, job_data) 형태의 pending job n개 생성 (Redis JSON 디코드 결과와 같은 타입)"""
+    return [
+        (org, i, asdict(PendingJob(12345 + i, org, i + 1, "build", f"{org}/repo", list(labels), float(i + 1))))
+        for i in range(n)
+    ]
 
 
 class TestCreateRunnerForJob:
@@ -14,39 +47,30 @@ class TestCreateRunnerForJob:
     @pytest.fixture
     def mock_dependencies(self, app_config):
         """태스크 의존성 Mock"""
-        with patch("app.tasks.get_config") as mock_config, \
-             patch("app.tasks.get_redis_client_sync") as mock_redis, \
-             patch("app.tasks.GitHubClient") as mock_github_cls, \
-             patch("app.tasks.KubernetesClient") as mock_k8s_cls:
-            
-            # Config mock
-            mock_config.return_value = app_config
-            
-            # Redis mock
-            redis_client = MagicMock()
-            mock_redis.return_value = redis_client
-            
-            # GitHub mock
-            github_client = MagicMock()
-            mock_github_cls.return_value = github_client
-            
-            # K8s mock
-            k8s_client = MagicMock()
-            mock_k8s_cls.return_value = k8s_client
-            
-            yield {
-                "config": app_config,
-                "redis": redis_client,
-                "github": github_client,
-                "k8s": k8s_client
-            }
+        with patch.multiple(
+            "app.tasks",
+            get_config=DEFAULT,
+            get_redis_client_sync=DEFAULT,
+            GitHubClient=DEFAULT,
+            KubernetesClient=DEFAULT
+        ) as mocks:
+            mocks["get_config"].return_value = app_config
+            yield mocks
+    
+    @pytest.fixture
+    def mock_retry(self):
+        """bind=True task의 self.retry를 직접 교체 (patch.object의 descriptor 탐색 회피)"""
+        mock = MagicMock(side_effect=Exception("Retry"))
+        create_runner_for_job.retry = mock
+        try:
+            yield mock
+        finally:
+            del create_runner_for_job.retry
     
     def test_create_runner_success(self, mock_dependencies, sample_jit_config):
         """Runner 생성 성공"""
-        from app.tasks import create_runner_for_job
-        
-        mock_dependencies["github"].create_jit_runner_config.return_value = sample_jit_config
-        mock_dependencies["k8s"].create_runner_pod.return_value = MagicMock()
+        mock_dependencies["GitHubClient"].return_value.create_jit_runner_config.return_value = sample_jit_config
+        mock_dependencies["KubernetesClient"].return_value.create_runner_pod.return_value = MagicMock()
         
         # Task 직접 호출 (Celery worker 없이)
         result = create_runner_for_job(
@@ -63,49 +87,69 @@ class TestCreateRunnerForJob:
         assert result["org"] == "test-org"
         
         # Redis 업데이트 확인
-        mock_dependencies["redis"].increment_org_running_sync.assert_called_with("test-org")
-        mock_dependencies["redis"].increment_total_running_sync.assert_called_once()
-        mock_dependencies["redis"].save_runner_info_sync.assert_called_once()
+        mock_dependencies["get_redis_client_sync"].return_value.increment_org_running_sync.assert_called_with("test-org")
+        mock_dependencies["get_redis_client_sync"].return_value.increment_total_running_sync.assert_called_once()
+        mock_dependencies["get_redis_client_sync"].return_value.save_runner_info_sync.assert_called_once()
     
-    def test_create_runner_github_error_retries(self, mock_dependencies):
+    def test_create_runner_github_error_retries(self, mock_dependencies, mock_retry):
         """GitHub API 에러 시 재시도"""
-        from app.tasks import create_runner_for_job
-        
-        mock_dependencies["github"].create_jit_runner_config.side_effect = Exception("API Error")
+        mock_dependencies["GitHubClient"].return_value.create_jit_runner_config.side_effect = Exception("API Error")
         
         # bind=True task는 self.retry를 호출함
-        with patch.object(create_runner_for_job, "retry") as mock_retry:
-            mock_retry.side_effect = Exception("Retry")
-            
-            with pytest.raises(Exception, match="Retry"):
-                create_runner_for_job(
-                    org_name="test-org",
-                    job_id=12345,
-                    run_id=67890,
-                    job_name="build",
-                    repo_full_name="test-org/test-repo",
-                    labels=["code-linux"]
-                )
+        with pytest.raises(Exception, match="Retry"):
+            create_runner_for_job(
+                org_name="test-org",
+                job_id=12345,
+                run_id=67890,
+                job_name="build",
+                repo_full_name="test-org/test-repo",
+                labels=["code-linux"]
+            )
+        
+        mock_retry.assert_called_once()
+        kwargs = mock_retry.call_args.kwargs
+        assert isinstance(kwargs["exc"], Exception)
+        # 첫 재시도는 default_retry_delay(30초) 하한 == retry_backoff 상한
+        assert kwargs["countdown"] == create_runner_for_job.default_retry_delay
     
-    def test_create_runner_k8s_error_retries(self, mock_dependencies, sample_jit_config):
-        """K8s 에러 시 재시도"""
-        from app.tasks import create_runner_for_job
-        
-        mock_dependencies["github"].create_jit_runner_config.return_value = sample_jit_config
-        mock_dependencies["k8s"].create_runner_pod.side_effect = Exception("K8s Error")
+    def test_create_runner_retry_backoff_config(self):
+        """재시도 백오프 설정 (GitHub/K8s API 재시도 폭주 방지)"""
+        assert create_runner_for_job.max_retries == 3
+        assert create_runner_for_job.retry_backoff == 30
+        assert create_runner_for_job.retry_backoff_max >= 600
+        assert create_runner_for_job.retry_jitter is True
+    
+    @pytest.mark.parametrize("retries", [0, 1, 2])
+    def test_retry_countdown_schedule(self, retries):
+        """재시도 대기 시간은 default_retry_delay 이상, 30초 * 2^n 이하"""
+        task = NS(
+            retry_backoff=create_runner_for_job.retry_backoff,
+            retry_backoff_max=create_runner_for_job.retry_backoff_max,
+            retry_jitter=create_runner_for_job.retry_jitter,
+            default_retry_delay=create_runner_for_job.default_retry_delay,
+            request=NS(retries=retries),
+        )
         
-        with patch.object(create_runner_for_job, "retry") as mock_retry:
-            mock_retry.side_effect = Exception("Retry")
-            
-            with pytest.raises(Exception, match="Retry"):
-                create_runner_for_job(
-                    org_name="test-org",
-                    job_id=12345,
-                    run_id=67890,
-                    job_name="build",
-                    repo_full_name="test-org/test-repo",
-                    labels=["code-linux"]
-                )
+        for _ in range(50):
+            countdown = _retry_countdown(task)
+            assert create_runner_for_job.default_retry_delay <= countdown <= 30 * 2 ** retries
+    
+    def test_create_runner_k8s_error_retries(self, mock_dependencies, mock_retry, sample_jit_config):
+        """K8s 에러 시 재시도"""
+        mock_dependencies["GitHubClient"].return_value.create_jit_runner_config.return_value = sample_jit_config
+        mock_dependencies["KubernetesClient"].return_value.create_runner_pod.side_effect = Exception("K8s Error")
+        
+        with pytest.raises(Exception, match="Retry"):
+            create_runner_for_job(
+                org_name="test-org",
+                job_id=12345,
+                run_id=67890,
+                job_name="build",
+                repo_full_name="test-org/test-repo",
+                labels=["code-linux"]
+            )
+        
+        mock_retry.assert_called_once()
 
 
 class TestProcessPendingQueues:
@@ -114,31 +158,19 @@ class TestProcessPendingQueues:
     @pytest.fixture
     def mock_dependencies(self, app_config):
         """태스크 의존성 Mock"""
-        with patch("app.tasks.get_config") as mock_config, \
-             patch("app.tasks.get_redis_client_sync") as mock_redis, \
-             patch("app.tasks.KubernetesClient") as mock_k8s_cls, \
-             patch("app.tasks._sync_running_state") as mock_sync:
-            
-            mock_config.return_value = app_config
-            
-            redis_client = MagicMock()
-            mock_redis.return_value = redis_client
-            
-            k8s_client = MagicMock()
-            mock_k8s_cls.return_value = k8s_client
-            
-            yield {
-                "config": app_config,
-                "redis": redis_client,
-                "k8s": k8s_client,
-                "sync": mock_sync
-            }
+        with patch.multiple(
+            "app.tasks",
+            get_config=DEFAULT,
+            get_redis_client_sync=DEFAULT,
+            KubernetesClient=DEFAULT,
+            _sync_running_state=DEFAULT
+        ) as mocks:
+            mocks["get_config"].return_value = app_config
+            yield mocks
     
     def test_process_skipped_when_total_limit_reached(self, mock_dependencies):
         """전체 제한 도달 시 건너뜀"""
-        from app.tasks import process_pending_queues
-        
-        mock_dependencies["redis"].get_total_running_sync.return_value = 200  # max_total
+        mock_dependencies["get_redis_client_sync"].return_value.get_total_running_sync.return_value = 200  # max_total
         
         result = process_pending_queues()
         
@@ -147,10 +179,8 @@ class TestProcessPendingQueues:
     
     def test_process_no_pending_jobs(self, mock_dependencies):
         """대기 중인 Job 없음"""
-        from app.tasks import process_pending_queues
-        
-        mock_dependencies["redis"].get_total_running_sync.return_value = 10
-        mock_dependencies["redis"].peek_all_pending_jobs_sync.return_value = []
+        mock_dependencies["get_redis_client_sync"].return_value.get_total_running_sync.return_value = 10
+        mock_dependencies["get_redis_client_sync"].return_value.peek_all_pending_jobs_sync.return_value = []
         
         result = process_pending_queues()
         
@@ -158,20 +188,15 @@ class TestProcessPendingQueues:
     
     def test_process_jobs_respects_org_limit(self, mock_dependencies):
         """Org 제한 존중"""
-        from app.tasks import process_pending_queues
-        
-        mock_dependencies["redis"].get_total_running_sync.return_value = 10
+        mock_dependencies["get_redis_client_sync"].return_value.get_total_running_sync.return_value = 10
         
         # 대기 중인 Job
-        pending_jobs = [
-            ("test-org", 0, {"job_id": 12345, "org_name": "test-org", "run_id": 1, "job_name": "build", "repo_full_name": "test-org/repo", "labels": [], "timestamp": 1}),
-            ("test-org", 1, {"job_id": 12346, "org_name": "test-org", "run_id": 2, "job_name": "build", "repo_full_name": "test-org/repo", "labels": [], "timestamp": 2}),
-        ]
-        mock_dependencies["redis"].peek_all_pending_jobs_sync.return_value = pending_jobs
+        pending_jobs = make_jobs("test-org", 2)
+        mock_dependencies["get_redis_client_sync"].return_value.peek_all_pending_jobs_sync.return_value = pending_jobs
         
         # Org 제한 도달
-        mock_dependencies["redis"].get_org_running_count_sync.return_value = 10  # max_per_org
-        mock_dependencies["redis"].get_effective_org_limit_sync.return_value = 10
+        mock_dependencies["get_redis_client_sync"].return_value.get_org_running_count_sync.return_value = 10  # max_per_org
+        mock_dependencies["get_redis_client_sync"].return_value.get_effective_org_limit_sync.return_value = 10
         
         result = process_pending_queues()
         
@@ -179,20 +204,16 @@ class TestProcessPendingQueues:
     
     def test_process_jobs_creates_runners(self, mock_dependencies):
         """Job 처리 및 Runner 생성"""
-        from app.tasks import process_pending_queues
-        
-        mock_dependencies["redis"].get_total_running_sync.return_value = 5
+        mock_dependencies["get_redis_client_sync"].return_value.get_total_running_sync.return_value = 5
         
         # 대기 중인 Job
-        pending_jobs = [
-            ("test-org", 0, {"job_id": 12345, "org_name": "test-org", "run_id": 1, "job_name": "build", "repo_full_name": "test-org/repo", "labels": ["code-linux"], "timestamp": 1}),
-        ]
-        mock_dependencies["redis"].peek_all_pending_jobs_sync.return_value = pending_jobs
+        pending_jobs = make_jobs("test-org", 1, labels=("code-linux",))
+        mock_dependencies["get_redis_client_sync"].return_value.peek_all_pending_jobs_sync.return_value = pending_jobs
         
         # 여유 슬롯 있음
-        mock_dependencies["redis"].get_org_running_count_sync.return_value = 3
-        mock_dependencies["redis"].get_effective_org_limit_sync.return_value = 10
-        mock_dependencies["redis"].remove_pending_jobs_by_job_ids_sync.return_value = 1
+        mock_dependencies["get_redis_client_sync"].return_value.get_org_running_count_sync.return_value = 3
+        mock_dependencies["get_redis_client_sync"].return_value.get_effective_org_limit_sync.return_value = 10
+        mock_dependencies["get_redis_client_sync"].return_value.remove_pending_jobs_by_job_ids_sync.return_value = 1
         
         with patch("app.tasks.create_runner_for_job") as mock_create:
             result = process_pending_queues()
@@ -203,9 +224,7 @@ class TestProcessPendingQueues:
     
     def test_process_error_handling(self, mock_dependencies):
         """에러 처리"""
-        from app.tasks import process_pending_queues
-        
-        mock_dependencies["redis"].get_total_running_sync.side_effect = Exception("Redis Error")
+        mock_dependencies["get_redis_client_sync"].return_value.get_total_running_sync.side_effect = Exception("Redis Error")
         
         result = process_pending_queues()
         
@@ -219,75 +238,41 @@ class TestCleanupStaleRunners:
     @pytest.fixture
     def mock_dependencies(self, app_config):
         """태스크 의존성 Mock"""
-        with patch("app.tasks.get_config") as mock_config, \
-             patch("app.tasks.get_redis_client_sync") as mock_redis, \
-             patch("app.tasks.KubernetesClient") as mock_k8s_cls:
-            
-            mock_config.return_value = app_config
-            
-            redis_client = MagicMock()
-            mock_redis.return_value = redis_client
-            
-            k8s_client = MagicMock()
-            mock_k8s_cls.return_value = k8s_client
-            
-            yield {
-                "config": app_config,
-                "redis": redis_client,
-                "k8s": k8s_client
-            }
+        with patch.multiple(
+            "app.tasks",
+            get_config=DEFAULT,
+            get_redis_client_sync=DEFAULT,
+            KubernetesClient=DEFAULT
+        ) as mocks:
+            mocks["get_config"].return_value = app_config
+            yield mocks
     
-    def test_cleanup_deletes_completed_pods(self, mock_dependencies):
-        """완료된 Pod 삭제"""
-        from app.tasks import cleanup_stale_runners
-        
-        # Succeeded Pod
-        mock_pod = MagicMock()
-        mock_pod.metadata.name = "jit-runner-12345"
-        mock_pod.status.phase = "Succeeded"
-        
-        mock_dependencies["k8s"].list_runner_pods.return_value = [mock_pod]
+    @pytest.mark.parametrize("phase,expected_deleted", [
+        ("Succeeded", 1),  # 완료된 Pod 삭제
+        ("Failed", 1),     # 실패한 Pod 삭제
+        ("Running", 0),    # 실행 중인 Pod 유지
+    ])
+    def test_cleanup_by_pod_phase(self, mock_dependencies, phase, expected_deleted):
+        """Pod 상태별 정리"""
+        mock_pod = NS(
+            metadata=NS(name="jit-runner-12345", labels={"org": "test-org"}),
+            status=NS(phase=phase)
+        )
+        k8s_client = mock_dependencies["KubernetesClient"].return_value
+        k8s_client.list_runner_pods.return_value = [mock_pod]
         
         result = cleanup_stale_runners()
         
         assert result["status"] == "completed"
-        assert result["deleted"] == 1
-        mock_dependencies["k8s"].delete_runner_pod.assert_called_with("jit-runner-12345")
-    
-    def test_cleanup_deletes_failed_pods(self, mock_dependencies):
-        """실패한 Pod 삭제"""
-        from app.tasks import cleanup_stale_runners
-        
-        mock_pod = MagicMock()
-        mock_pod.metadata.name = "jit-runner-12345"
-        mock_pod.status.phase = "Failed"
-        
-        mock_dependencies["k8s"].list_runner_pods.return_value = [mock_pod]
-        
-        result = cleanup_stale_runners()
-        
-        assert result["deleted"] == 1
-    
-    def test_cleanup_keeps_running_pods(self, mock_dependencies):
-        """실행 중인 Pod 유지"""
-        from app.tasks import cleanup_stale_runners
-        
-        mock_pod = MagicMock()
-        mock_pod.metadata.name = "jit-runner-12345"
-        mock_pod.status.phase = "Running"
-        
-        mock_dependencies["k8s"].list_runner_pods.return_value = [mock_pod]
-        
-        result = cleanup_stale_runners()
-        
-        assert result["deleted"] == 0
-        mock_dependencies["k8s"].delete_runner_pod.assert_not_called()
+        assert result["deleted"] == expected_deleted
+        if expected_deleted:
+            k8s_client.delete_runner_pod.assert_called_with("jit-runner-12345")
+        else:
+            k8s_client.delete_runner_pod.assert_not_called()
     
     def test_cleanup_error_handling(self, mock_dependencies):
         """에러 처리"""
-        from app.tasks import cleanup_stale_runners
-        
-        mock_dependencies["k8s"].list_runner_pods.side_effect = Exception("K8s Error")
+        mock_dependencies["KubernetesClient"].return_value.list_runner_pods.side_effect = Exception("K8s Error")
         
         result = cleanup_stale_runners()
         
@@ -300,40 +285,26 @@ class TestSyncRedisState:
     @pytest.fixture
     def mock_dependencies(self, app_config):
         """태스크 의존성 Mock"""
-        with patch("app.tasks.get_config") as mock_config, \
-             patch("app.tasks.get_redis_client_sync") as mock_redis, \
-             patch("app.tasks.KubernetesClient") as mock_k8s_cls, \
-             patch("app.tasks._sync_running_state") as mock_sync:
-            
-            mock_config.return_value = app_config
-            
-            redis_client = MagicMock()
-            mock_redis.return_value = redis_client
-            
-            k8s_client = MagicMock()
-            mock_k8s_cls.return_value = k8s_client
-            
-            yield {
-                "config": app_config,
-                "redis": redis_client,
-                "k8s": k8s_client,
-                "sync": mock_sync
-            }
+        with patch.multiple(
+            "app.tasks",
+            get_config=DEFAULT,
+            get_redis_client_sync=DEFAULT,
+            KubernetesClient=DEFAULT,
+            _sync_running_state=DEFAULT
+        ) as mocks:
+            mocks["get_config"].return_value = app_config
+            yield mocks
     
     def test_sync_redis_state_success(self, mock_dependencies):
         """Redis 상태 동기화 성공"""
-        from app.tasks import sync_redis_state
-        
         result = sync_redis_state()
         
         assert result["status"] == "completed"
-        mock_dependencies["sync"].assert_called_once()
+        mock_dependencies["_sync_running_state"].assert_called_once()
     
     def test_sync_redis_state_error(self, mock_dependencies):
         """Redis 상태 동기화 에러"""
-        from app.tasks import sync_redis_state
-        
-        mock_dependencies["sync"].side_effect = Exception("Sync Error")
+        mock_dependencies["_sync_running_state"].side_effect = Exception("Sync Error")
         
         result = sync_redis_state()
         
@@ -348,21 +319,19 @@ class TestSyncRunningState:
         with patch("app.tasks.get_config") as mock_config:
             mock_config.return_value = app_config
             
-            from app.tasks import _sync_running_state
-            
             mock_redis = MagicMock()
             mock_k8s = MagicMock()
             
             # Running Pod 2개
-            mock_pod1 = MagicMock()
-            mock_pod1.metadata.name = "jit-runner-1"
-            mock_pod1.metadata.labels = {"org": "test-org"}
-            mock_pod1.status.phase = "Running"
+            mock_pod1 = NS(
+                metadata=NS(name="jit-runner-1", labels={"org": "test-org"}),
+                status=NS(phase="Running")
+            )
             
-            mock_pod2 = MagicMock()
-            mock_pod2.metadata.name = "jit-runner-2"
-            mock_pod2.metadata.labels = {"org": "test-org"}
-            mock_pod2.status.phase = "Running"
+            mock_pod2 = NS(
+                metadata=NS(name="jit-runner-2", labels={"org": "test-org"}),
+                status=NS(phase="Running")
+            )
             
             mock_k8s.list_runner_pods.return_value = [mock_pod1, mock_pod2]
             
@@ -380,8 +349,6 @@ class TestSyncRunningState:
         with patch("app.tasks.get_config") as mock_config:
             mock_config.return_value = app_config
             
-            from app.tasks import _sync_running_state
-            
             mock_redis = MagicMock()
             mock_k8s = MagicMock()
             
@@ -406,8 +373,6 @@ class TestGetOrgsWithPendingJobs:
     
     def test_returns_orgs_with_pending_jobs(self, app_config):
         """대기 중인 Job이 있는 Org 목록 반환"""
-        from app.tasks import _get_orgs_with_pending_jobs
-        
         mock_redis = MagicMock()
         mock_redis.client.scan_iter.return_value = iter([
             b"org:test-org-1:pending",
@@ -418,11 +383,13 @@ class TestGetOrgsWithPendingJobs:
         result = _get_orgs_with_pending_jobs(mock_redis)
         
         assert result == ["test-org-1"]
+        # 대규모 keyspace에서 SCAN round-trip이 과다해지지 않도록 match/count 지정
+        mock_redis.client.scan_iter.assert_called_once_with(
+            match="org:*:pending", count=PENDING_SCAN_COUNT
+        )
     
     def test_returns_empty_when_no_pending_jobs(self, app_config):
         """대기 중인 Job 없을 때 빈 목록"""
-        from app.tasks import _get_orgs_with_pending_jobs
-        
         mock_redis = MagicMock()
         mock_redis.client.scan_iter.return_value = iter([])
         
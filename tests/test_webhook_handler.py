@@ -4,21 +4,30 @@ Webhook 핸들러 테스트
 app/webhook_handler.py의 Webhook 처리 로직 테스트
 """
 
-import json
-import hashlib
 import hmac
+import functools
+import orjson
 import pytest
-from unittest.mock import MagicMock, AsyncMock, patch
-from fastapi.testclient import TestClient
 
 
+class FakeRedis:
+    """Webhook 핸들러가 사용하는 RedisClient 메서드만 구현한 Fake"""
+    
+    def __init__(self):
+        self.add_pending_job_calls = []
+    
+    async def add_pending_job(self, *args, **kwargs):
+        self.add_pending_job_calls.append((args, kwargs))
+
+
+@functools.lru_cache(maxsize=None)
 def calculate_signature(payload_bytes: bytes, secret: str) -> str:
-    """Webhook 서명 계산 헬퍼"""
-    return "sha256=" + hmac.new(
+    """Webhook 서명 계산 헬퍼 (동일 페이로드는 캐시된 서명 재사용)"""
+    return "sha256=" + hmac.digest(
         secret.encode("utf-8"),
         payload_bytes,
-        hashlib.sha256
-    ).hexdigest()
+        "sha256"
+    ).hex()
 
 
 class TestVerifyWebhookSignature:
@@ -73,18 +82,29 @@ class TestVerifyWebhookSignature:
         assert result is False
 
 
+@pytest.mark.usefixtures("app_config")
 class TestWebhookHandler:
     """Webhook 핸들러 엔드포인트 테스트"""
     
     @pytest.fixture
-    def client(self, app_config):
-        """테스트 클라이언트"""
+    def client(self, app_client_no_lifespan):
+        """테스트 클라이언트 (세션 공유)"""
+        return app_client_no_lifespan
+    
+    @pytest.fixture(autouse=True)
+    def fake_redis_client(self):
+        """Redis 클라이언트 의존성을 FakeRedis로 대체 (실제 전역 클라이언트 생성 방지)"""
         from app.main import app
-        return TestClient(app)
+        from app.webhook_handler import redis_client_dependency
+        
+        fake = FakeRedis()
+        app.dependency_overrides[redis_client_dependency] = lambda: fake
+        yield fake
+        app.dependency_overrides.pop(redis_client_dependency, None)
     
     def _make_signed_request(self, client, payload: dict, event_type: str = "workflow_job"):
         """서명된 요청 생성 헬퍼"""
-        payload_bytes = json.dumps(payload).encode()
+        payload_bytes = orjson.dumps(payload)
         signature = calculate_signature(payload_bytes, "test-webhook-secret")
         
         headers = {
@@ -117,9 +137,14 @@ class TestWebhookHandler:
     
     # ==================== 이벤트 타입 테스트 ====================
     
-    def test_webhook_ignores_non_workflow_job_events(self, client, sample_workflow_job_payload):
+    def test_webhook_ignores_non_workflow_job_events(self, client, signed_workflow_job):
         """workflow_job 외 이벤트 무시"""
-        response = self._make_signed_request(client, sample_workflow_job_payload, "push")
+        payload_bytes, headers = signed_workflow_job
+        response = client.post(
+            "/webhook",
+            content=payload_bytes,
+            headers={**headers, "X-GitHub-Event": "push"}
+        )
         
         assert response.status_code == 200
         assert response.json()["status"] == "ignored"
@@ -185,19 +210,18 @@ class TestWebhookHandler:
     
     # ==================== Action 처리 테스트 ====================
     
-    def test_webhook_queued_action(self, client, sample_workflow_job_payload):
+    def test_webhook_queued_action(self, client, fake_redis_client, signed_workflow_job):
         """queued 액션 처리"""
-        with patch("app.webhook_handler.get_redis_client") as mock_get_redis:
-            mock_redis = AsyncMock()
-            mock_redis.add_pending_job = AsyncMock()
-            mock_get_redis.return_value = mock_redis
-            
-            response = self._make_signed_request(client, sample_workflow_job_payload)
-            
-            assert response.status_code == 200
-            assert response.json()["status"] == "queued"
-            assert response.json()["action"] == "queued"
-            mock_redis.add_pending_job.assert_called_once()
+        payload_bytes, headers = signed_workflow_job
+        response = client.post("/webhook", content=payload_bytes, headers=headers)
+        
+        assert response.status_code == 200
+        assert response.json()["status"] == "queued"
+        assert response.json()["action"] == "queued"
+        assert len(fake_redis_client.add_pending_job_calls) == 1
+        _, kwargs = fake_redis_client.add_pending_job_calls[0]
+        assert kwargs["org_name"] == "test-org"
+        assert kwargs["job_id"] == 12345
     
     def test_webhook_in_progress_action(self, client, create_webhook_payload):
         """in_progress 액션 처리"""
@@ -245,12 +269,9 @@ class TestWebhookHandler:
 class TestWebhookTestEndpoint:
     """Webhook 테스트 엔드포인트 테스트"""
     
-    def test_webhook_test_endpoint(self, app_config):
+    def test_webhook_test_endpoint(self, app_client_no_lifespan, app_config):
         """테스트 엔드포인트"""
-        from app.main import app
-        client = TestClient(app)
-        
-        response = client.get("/webhook/test")
+        response = app_client_no_lifespan.get("/webhook/test")
         
         assert response.status_code == 200
         assert response.json()["status"] == "ok"
@@ -5,15 +5,30 @@ Integration Test Configuration and Fixtures
 실제 Redis, Kubernetes, Mock GitHub API 서버를 사용합니다.
 """
 
-import json
+import functools
+import hmac
 import os
 import sys
 import time
-from typing import Dict, Generator
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncGenerator, Callable, Dict, Generator, Tuple, Type
 
 import httpx
+import orjson
 import pytest
+import pytest_asyncio
 import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+try:
+    from kubernetes import client as k8s_client_mod, config as k8s_config_mod
+    from kubernetes.client.rest import ApiException
+    _K8S_OK = True
+except ImportError:
+    _K8S_OK = False
 
 # 프로젝트 루트를 Python path에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -39,9 +54,26 @@ def pytest_configure(config):
     )
 
 
+# xdist 그룹 -> 해당 백엔드 상태를 건드리는 fixture (먼저 매칭되는 그룹 적용)
+# 앱은 Redis와 GitHub Mock 상태를 함께 쓰고 clean_github_mock은 Mock 전체를 리셋하므로
+# Redis / GitHub Mock / 앱을 거치는 테스트는 모두 하나의 그룹에서 순서대로 실행
+_XDIST_GROUP_FIXTURES = (
+    ("shared_services", {
+        "redis_client", "clean_redis", "app_client", "webhook_helper",
+        "github_mock_client", "async_github_mock_client", "clean_github_mock",
+    }),
+    ("kubernetes", {"k8s_client", "clean_k8s_namespace"}),
+)
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(config, items):
     """
     --integration 옵션이 없으면 integration 테스트 스킵
+    
+    xdist_group 마커를 붙여 `pytest -n auto --dist loadgroup` 실행 시
+    Redis / GitHub Mock 상태를 공유하는 테스트는 한 worker에서 순서대로 실행되고,
+    Kubernetes 테스트 등 상태가 겹치지 않는 그룹끼리만 병렬로 실행되도록 합니다.
     """
     if not config.getoption("--integration", default=False):
         skip_integration = pytest.mark.skip(
@@ -50,6 +82,30 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if "integration" in item.keywords:
                 item.add_marker(skip_integration)
+    
+    for item in items:
+        fixturenames = set(getattr(item, "fixturenames", ()))
+        for group, fixtures in _XDIST_GROUP_FIXTURES:
+            if fixturenames & fixtures:
+                item.add_marker(pytest.mark.xdist_group(name=group))
+                break
+
+
+def pytest_runtest_setup(item):
+    """
+    서비스 마커(redis, github_mock)가 붙은 테스트는 해당 서비스 사전 점검 결과에 따라 스킵
+    
+    점검은 서비스별로 세션당 한 번만 수행하고 결과를 config.stash에 보관하므로,
+    서비스가 내려가 있을 때 테스트마다 연결 재시도를 반복하지 않습니다.
+    """
+    results = item.config.stash.setdefault(_PREFLIGHT_KEY, {})
+    for marker, probe in _SERVICE_PROBES.items():
+        if item.get_closest_marker(marker) is None:
+            continue
+        if marker not in results:
+            results[marker] = probe(IntegrationEnv.from_environ())
+        if not results[marker]:
+            pytest.skip(f"{marker} 서비스에 연결할 수 없습니다.")
 
 
 def pytest_addoption(parser):
@@ -60,37 +116,148 @@ def pytest_addoption(parser):
         default=False,
         help="Run integration tests"
     )
+    parser.addoption(
+        "--k8s-reprobe",
+        action="store_true",
+        default=False,
+        help="Ignore cached Kubernetes availability and probe the cluster again"
+    )
 
 
 # =============================================================================
 # Environment Configuration
 # =============================================================================
 
+@dataclass(frozen=True, slots=True)
+class IntegrationEnv:
+    """통합 테스트용 설정 (세션 시작 시 한 번만 환경 변수에서 읽음)"""
+    ghes_url: str
+    ghes_api_url: str
+    github_pat: str
+    webhook_secret: str
+    webhook_secret_bytes: bytes
+    redis_url: str
+    redis_host: str
+    redis_port: int
+    redis_password: str
+    redis_cleanup_pattern: str
+    admin_api_key: str
+    runner_namespace: str
+    max_runners_per_org: str
+    max_total_runners: str
+    runner_labels: str
+    app_url: str
+    
+    @classmethod
+    def from_environ(cls) -> "IntegrationEnv":
+        webhook_secret = os.getenv("WEBHOOK_SECRET", "test-webhook-secret")
+        return cls(
+            ghes_url=os.getenv("GHES_URL", "http://localhost:8080"),
+            ghes_api_url=os.getenv("GHES_API_URL", "http://localhost:8080/api/v3"),
+            github_pat=os.getenv("GITHUB_PAT", "test-integration-token"),
+            webhook_secret=webhook_secret,
+            webhook_secret_bytes=webhook_secret.encode(),
+            redis_url=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+            redis_host=os.getenv("REDIS_HOST", "localhost"),
+            redis_port=int(os.getenv("REDIS_PORT", "6379")),
+            redis_password=os.getenv("REDIS_PASSWORD", "testpassword"),
+            redis_cleanup_pattern=os.getenv("REDIS_CLEANUP_PATTERN", "*"),
+            admin_api_key=os.getenv("ADMIN_API_KEY", "test-admin-key"),
+            runner_namespace=os.getenv("RUNNER_NAMESPACE", "jit-runners"),
+            max_runners_per_org=os.getenv("MAX_RUNNERS_PER_ORG", "10"),
+            max_total_runners=os.getenv("MAX_TOTAL_RUNNERS", "50"),
+            runner_labels=os.getenv("RUNNER_LABELS", "code-linux,integration-test"),
+            app_url=os.getenv("APP_URL", "http://localhost:8000"),
+        )
+    
+    def as_environ(self) -> Dict[str, str]:
+        """앱 설정 로딩에 필요한 환경 변수 형태로 변환"""
+        return {
+            "GHES_URL": self.ghes_url,
+            "GHES_API_URL": self.ghes_api_url,
+            "GITHUB_PAT": self.github_pat,
+            "WEBHOOK_SECRET": self.webhook_secret,
+            "REDIS_URL": self.redis_url,
+            "REDIS_PASSWORD": self.redis_password,
+            "ADMIN_API_KEY": self.admin_api_key,
+            "RUNNER_NAMESPACE": self.runner_namespace,
+            "MAX_RUNNERS_PER_ORG": self.max_runners_per_org,
+            "MAX_TOTAL_RUNNERS": self.max_total_runners,
+            "RUNNER_LABELS": self.runner_labels,
+        }
+
+
 @pytest.fixture(scope="session")
-def integration_env() -> Dict[str, str]:
-    """통합 테스트용 환경 변수"""
-    return {
-        "GHES_URL": os.getenv("GHES_URL", "http://localhost:8080"),
-        "GHES_API_URL": os.getenv("GHES_API_URL", "http://localhost:8080/api/v3"),
-        "GITHUB_PAT": os.getenv("GITHUB_PAT", "test-integration-token"),
-        "WEBHOOK_SECRET": os.getenv("WEBHOOK_SECRET", "test-webhook-secret"),
-        "REDIS_URL": os.getenv("REDIS_URL", "redis://localhost:6379/0"),
-        "REDIS_PASSWORD": os.getenv("REDIS_PASSWORD", "testpassword"),
-        "ADMIN_API_KEY": os.getenv("ADMIN_API_KEY", "test-admin-key"),
-        "RUNNER_NAMESPACE": os.getenv("RUNNER_NAMESPACE", "jit-runners"),
-        "MAX_RUNNERS_PER_ORG": os.getenv("MAX_RUNNERS_PER_ORG", "10"),
-        "MAX_TOTAL_RUNNERS": os.getenv("MAX_TOTAL_RUNNERS", "50"),
-        "RUNNER_LABELS": os.getenv("RUNNER_LABELS", "code-linux,integration-test"),
-    }
+def integration_env() -> IntegrationEnv:
+    """통합 테스트용 환경 설정 (읽기 전용)"""
+    return IntegrationEnv.from_environ()
 
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_env(integration_env):
-    """테스트 전에 환경 변수 설정"""
-    for key, value in integration_env.items():
-        os.environ[key] = value
-    yield
-    # 테스트 후 정리 (필요한 경우)
+    """테스트 전에 환경 변수 설정 (세션 종료 시 원래 값으로 복원)"""
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in integration_env.as_environ().items():
+            mp.setenv(key, value)
+        yield
+
+
+# =============================================================================
+# Connection Helpers
+# =============================================================================
+
+def _wait_for(
+    check: Callable[[], bool],
+    errors: Tuple[Type[BaseException], ...] = (),
+    attempts: int = 10,
+    base: float = 0.05,
+    cap: float = 2.0
+) -> bool:
+    """check()가 True를 반환할 때까지 지수 백오프(50ms, 100ms, ... 최대 cap)로 재시도
+    
+    errors에 해당하는 예외는 아직 준비되지 않은 것으로 간주합니다.
+    """
+    for i in range(attempts):
+        try:
+            if check():
+                return True
+        except errors:
+            pass
+        if i < attempts - 1:
+            time.sleep(min(cap, base * 2 ** i))
+    return False
+
+
+def _probe_redis(env: IntegrationEnv) -> bool:
+    """Redis 사전 점검 (PING, 재시도는 _wait_for에 맡기고 클라이언트 자체 재시도는 끔)"""
+    probe = redis.Redis(
+        host=env.redis_host,
+        port=env.redis_port,
+        password=env.redis_password,
+        socket_connect_timeout=1.0,
+        retry=Retry(NoBackoff(), 0)
+    )
+    try:
+        return _wait_for(probe.ping, errors=(redis.RedisError,))
+    finally:
+        probe.close()
+
+
+def _probe_github_mock(env: IntegrationEnv) -> bool:
+    """GitHub Mock 서버 사전 점검 (GET /)"""
+    with httpx.Client(base_url=env.ghes_url, timeout=2.0) as probe:
+        return _wait_for(
+            lambda: probe.get("/").status_code == 200,
+            errors=(httpx.HTTPError,)
+        )
+
+
+# 마커 이름 -> 서비스 사전 점검 함수
+_SERVICE_PROBES: Dict[str, Callable[[IntegrationEnv], bool]] = {
+    "redis": _probe_redis,
+    "github_mock": _probe_github_mock,
+}
+_PREFLIGHT_KEY = pytest.StashKey[Dict[str, bool]]()
 
 
 # =============================================================================
@@ -98,26 +265,28 @@ def setup_env(integration_env):
 # =============================================================================
 
 @pytest.fixture(scope="session")
-def redis_client(integration_env) -> Generator[redis.Redis, None, None]:
-    """실제 Redis 클라이언트"""
-    client = redis.Redis(
-        host=os.getenv("REDIS_HOST", "localhost"),
-        port=int(os.getenv("REDIS_PORT", "6379")),
-        password=integration_env.get("REDIS_PASSWORD"),
+def redis_pool(integration_env) -> Generator[redis.ConnectionPool, None, None]:
+    """세션 공유 Redis 커넥션 풀 (테스트마다 TCP 연결/AUTH 반복 방지)"""
+    pool = redis.ConnectionPool(
+        host=integration_env.redis_host,
+        port=integration_env.redis_port,
+        password=integration_env.redis_password,
         db=0,
-        decode_responses=True
+        decode_responses=True,
+        max_connections=32
     )
+    yield pool
+    pool.disconnect()
+
+
+@pytest.fixture(scope="session")
+def redis_client(redis_pool) -> Generator[redis.Redis, None, None]:
+    """실제 Redis 클라이언트"""
+    client = redis.Redis(connection_pool=redis_pool)
     
     # 연결 확인
-    max_retries = 10
-    for i in range(max_retries):
-        try:
-            client.ping()
-            break
-        except redis.ConnectionError:
-            if i == max_retries - 1:
-                pytest.fail("Redis 서버에 연결할 수 없습니다.")
-            time.sleep(1)
+    if not _wait_for(client.ping, errors=(redis.ConnectionError,)):
+        pytest.fail("Redis 서버에 연결할 수 없습니다.")
     
     yield client
     
@@ -125,62 +294,117 @@ def redis_client(integration_env) -> Generator[redis.Redis, None, None]:
     client.close()
 
 
+# 공유 Redis에서 패턴에 맞는 키를 SCAN 한 페이지씩 UNLINK하고 다음 커서를 반환
+# (스크립트 한 번이 전체 키스페이스를 순회하며 서버를 오래 점유하지 않도록 커서 순회는 클라이언트에서)
+_CLEANUP_PAGE_LUA = """
+local result = redis.call("SCAN", ARGV[1], "MATCH", ARGV[2], "COUNT", 1000)
+for _, key in ipairs(result[2]) do
+    redis.call("UNLINK", key)
+end
+return result[1]
+"""
+
+
 @pytest.fixture
-def clean_redis(redis_client) -> Generator[redis.Redis, None, None]:
-    """각 테스트 전에 Redis 데이터 정리"""
+def clean_redis(redis_client, integration_env) -> Generator[redis.Redis, None, None]:
+    """각 테스트 전후 Redis 데이터 정리
+    
+    기본은 FLUSHDB ASYNC 한 번, REDIS_CLEANUP_PATTERN이 지정된 경우(공유 Redis)
+    해당 패턴의 키만 SCAN 페이지 단위 Lua 스크립트로 UNLINK합니다. 메모리 해제는
+    Redis가 백그라운드에서 처리하므로 정리 대기 시간이 값 크기에 비례하지 않습니다.
+    """
+    pattern = integration_env.redis_cleanup_pattern
+    script = redis_client.register_script(_CLEANUP_PAGE_LUA)
+    
+    def cleanup():
+        if pattern == "*":
+            redis_client.flushdb(asynchronous=True)
+            return
+        cursor = "0"
+        while True:
+            cursor = script(args=[cursor, pattern])
+            if cursor == "0":
+                break
+    
     # 테스트 전 정리
-    for key in redis_client.scan_iter("*"):
-        redis_client.delete(key)
+    cleanup()
     
     yield redis_client
     
     # 테스트 후 정리
-    for key in redis_client.scan_iter("*"):
-        redis_client.delete(key)
+    cleanup()
 
 
 # =============================================================================
 # GitHub Mock Server Fixtures
 # =============================================================================
 
+# 세션 클라이언트 공통 연결 풀 설정 (keep-alive 연결을 세션 내내 재사용)
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=300.0
+)
+
 @pytest.fixture(scope="session")
 def github_mock_url(integration_env) -> str:
     """GitHub Mock 서버 URL"""
-    return integration_env["GHES_URL"]
+    return integration_env.ghes_url
 
 
 @pytest.fixture(scope="session")
 def github_mock_api_url(integration_env) -> str:
     """GitHub Mock API URL"""
-    return integration_env["GHES_API_URL"]
+    return integration_env.ghes_api_url
 
 
 @pytest.fixture(scope="session")
 def github_mock_client(github_mock_url) -> Generator[httpx.Client, None, None]:
     """GitHub Mock 서버 HTTP 클라이언트"""
-    client = httpx.Client(base_url=github_mock_url, timeout=30.0)
+    client = httpx.Client(
+        base_url=github_mock_url,
+        timeout=30.0,
+        http2=True,
+        limits=_HTTP_LIMITS
+    )
     
     # 연결 확인
-    max_retries = 10
-    for i in range(max_retries):
-        try:
-            response = client.get("/")
-            if response.status_code == 200:
-                break
-        except httpx.ConnectError:
-            if i == max_retries - 1:
-                pytest.fail("GitHub Mock 서버에 연결할 수 없습니다.")
-            time.sleep(1)
+    if not _wait_for(
+        lambda: client.get("/").status_code == 200,
+        errors=(httpx.ConnectError,)
+    ):
+        pytest.fail("GitHub Mock 서버에 연결할 수 없습니다.")
     
     yield client
     client.close()
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_github_mock_client(
+    github_mock_client,
+    github_mock_url
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """동시 요청용 GitHub Mock 비동기 HTTP 클라이언트 (연결 확인은 github_mock_client가 수행)"""
+    async with httpx.AsyncClient(
+        base_url=github_mock_url,
+        timeout=30.0,
+        http2=True,
+        limits=_HTTP_LIMITS
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def default_runner_group_id(github_mock_client) -> int:
+    """test-org 기본 Runner 그룹 ID (mock 초기 상태에서 고정이므로 세션당 한 번 조회)"""
+    response = github_mock_client.get("/api/v3/orgs/test-org/actions/runner-groups")
+    return next(g["id"] for g in response.json()["runner_groups"] if g["default"])
+
+
 @pytest.fixture
 def clean_github_mock(github_mock_client) -> Generator[httpx.Client, None, None]:
-    """각 테스트 전에 GitHub Mock 상태 초기화"""
+    """각 테스트 전에 GitHub Mock 상태 초기화 (/test/reset이 API 호출 기록도 비움)"""
     github_mock_client.post("/test/reset")
-    github_mock_client.delete("/test/api-calls")
     yield github_mock_client
 
 
@@ -189,118 +413,211 @@ def clean_github_mock(github_mock_client) -> Generator[httpx.Client, None, None]
 # =============================================================================
 
 @pytest.fixture(scope="session")
-def app_url() -> str:
+def app_url(integration_env) -> str:
     """JIT Runner Manager 앱 URL"""
-    return os.getenv("APP_URL", "http://localhost:8000")
+    return integration_env.app_url
 
 
 @pytest.fixture(scope="session")
 def app_client(app_url) -> Generator[httpx.Client, None, None]:
     """JIT Runner Manager HTTP 클라이언트"""
-    client = httpx.Client(base_url=app_url, timeout=30.0)
+    client = httpx.Client(
+        base_url=app_url,
+        timeout=30.0,
+        http2=True,
+        limits=_HTTP_LIMITS
+    )
     
-    # 연결 확인
-    max_retries = 15
-    for i in range(max_retries):
-        try:
-            response = client.get("/health")
-            if response.status_code == 200:
-                break
-        except httpx.ConnectError:
-            if i == max_retries - 1:
-                pytest.fail("JIT Runner Manager 앱에 연결할 수 없습니다.")
-            time.sleep(2)
+    # 연결 확인 (앱 기동이 가장 느리므로 시도 횟수를 늘림)
+    if not _wait_for(
+        lambda: client.get("/health").status_code == 200,
+        errors=(httpx.ConnectError,),
+        attempts=20
+    ):
+        pytest.fail("JIT Runner Manager 앱에 연결할 수 없습니다.")
     
     yield client
     client.close()
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_app_client(app_url) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """동시 webhook 전송용 비동기 HTTP 클라이언트 (세션 이벤트 루프에 바인딩)"""
+    async with httpx.AsyncClient(
+        base_url=app_url,
+        timeout=30.0,
+        http2=True,
+        headers=_BASE_WEBHOOK_HEADERS,
+        limits=_HTTP_LIMITS
+    ) as client:
+        yield client
+
+
 # =============================================================================
 # Kubernetes Fixtures
 # =============================================================================
 
-@pytest.fixture(scope="session")
-def k8s_available() -> bool:
-    """Kubernetes 클러스터 사용 가능 여부"""
+# 클러스터 사용 가능 확인 결과를 pytest 캐시에 보관하는 기간 (초)
+_K8S_PROBE_CACHE_KEY = "k8s/available"
+_K8S_PROBE_TTL = 600
+
+
+def _connect_k8s(verify: bool):
+    """kubeconfig 로드 후 CoreV1Api 반환 (verify 시 API 호출로 연결 확인), 실패 시 None"""
+    if not _K8S_OK:
+        return None
+    
     try:
-        from kubernetes import client, config as k8s_config
-        
         try:
-            k8s_config.load_incluster_config()
-        except k8s_config.ConfigException:
-            k8s_config.load_kube_config()
+            k8s_config_mod.load_incluster_config()
+        except k8s_config_mod.ConfigException:
+            k8s_config_mod.load_kube_config()
         
-        v1 = client.CoreV1Api()
-        v1.list_namespace(limit=1)
-        return True
+        v1 = k8s_client_mod.CoreV1Api()
+        if verify:
+            v1.list_namespace(limit=1)
+        return v1
     except Exception:
-        return False
+        return None
 
 
 @pytest.fixture(scope="session")
-def k8s_client(k8s_available):
-    """Kubernetes 클라이언트 (사용 가능한 경우)"""
-    if not k8s_available:
-        pytest.skip("Kubernetes 클러스터를 사용할 수 없습니다.")
+def k8s_available(request):
+    """Kubernetes 클러스터 사용 가능 시 CoreV1Api 클라이언트, 아니면 None
+    
+    직전 실행에서 사용 가능으로 확인된 결과가 TTL 이내이면 재확인하지 않습니다
+    (--k8s-reprobe로 무시). 사용 불가 결과는 캐시하지 않으므로 클러스터가 뜨면
+    다음 실행에서 바로 다시 확인합니다.
+    """
+    cache = getattr(request.config, "cache", None)
+    cached = None
+    if cache is not None and not request.config.getoption("--k8s-reprobe"):
+        cached = cache.get(_K8S_PROBE_CACHE_KEY, None)
     
-    from kubernetes import client, config as k8s_config
+    if cached is not None and time.time() - cached["checked_at"] < _K8S_PROBE_TTL:
+        return _connect_k8s(verify=False)
     
-    try:
-        k8s_config.load_incluster_config()
-    except k8s_config.ConfigException:
-        k8s_config.load_kube_config()
+    v1 = _connect_k8s(verify=True)
+    if cache is not None:
+        cache.set(
+            _K8S_PROBE_CACHE_KEY,
+            {"checked_at": time.time()} if v1 is not None else None
+        )
+    return v1
+
+
+@pytest.fixture(scope="session")
+def k8s_client(k8s_available):
+    """Kubernetes 클라이언트 (사용 가능한 경우, 연결 확인에 사용한 클라이언트 재사용)"""
+    if k8s_available is None:
+        pytest.skip("Kubernetes 클러스터를 사용할 수 없습니다.")
     
-    return client.CoreV1Api()
+    return k8s_available
+
+
+@pytest.fixture(scope="session")
+def k8s_background_deleter() -> Generator[ThreadPoolExecutor, None, None]:
+    """테스트 namespace 삭제 요청을 백그라운드로 보내는 executor (세션 종료 시 완료 대기)"""
+    executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="k8s-ns-delete")
+    yield executor
+    executor.shutdown(wait=True)
 
 
 @pytest.fixture
-def clean_k8s_namespace(k8s_client, integration_env):
-    """테스트용 namespace의 Pod 정리"""
-    namespace = integration_env["RUNNER_NAMESPACE"]
+def clean_k8s_namespace(k8s_client, k8s_background_deleter) -> Generator[str, None, None]:
+    """테스트별 고유 namespace 생성 후 이름 반환 (테스트 종료 후 백그라운드 삭제)
     
-    # 기존 jit-runner Pod 삭제
-    try:
-        pods = k8s_client.list_namespaced_pod(
-            namespace=namespace,
-            label_selector="app=jit-runner"
+    테스트마다 namespace가 분리되므로 이전 테스트의 Pod 정리나 이름 충돌을 기다리지 않습니다.
+    """
+    namespace = f"jit-test-{uuid.uuid4().hex[:8]}"
+    k8s_client.create_namespace(
+        body=k8s_client_mod.V1Namespace(
+            metadata=k8s_client_mod.V1ObjectMeta(name=namespace)
         )
-        for pod in pods.items:
-            k8s_client.delete_namespaced_pod(
-                name=pod.metadata.name,
-                namespace=namespace
-            )
-    except Exception:
-        pass  # namespace가 없으면 무시
+    )
+    
+    # default ServiceAccount가 생성되기 전에는 Pod 생성이 거부되므로 대기
+    _wait_for(
+        lambda: k8s_client.read_namespaced_service_account(
+            name="default",
+            namespace=namespace
+        ) is not None,
+        errors=(ApiException,)
+    )
     
-    yield k8s_client
+    yield namespace
+    
+    k8s_background_deleter.submit(
+        k8s_client.delete_namespace,
+        name=namespace,
+        propagation_policy="Background"
+    )
+
+
+@pytest.fixture
+def created_pod_factory(k8s_client, clean_k8s_namespace) -> Callable:
+    """테스트 namespace에 Pod를 생성하는 헬퍼 (Pod는 namespace 삭제 시 함께 정리됨)"""
+    def create(pod):
+        return k8s_client.create_namespaced_pod(namespace=clean_k8s_namespace, body=pod)
+    
+    return create
 
 
 # =============================================================================
 # Webhook Helpers
 # =============================================================================
 
-@pytest.fixture
-def webhook_helper(app_client, integration_env):
-    """Webhook 전송 헬퍼"""
+# 요청마다 변하지 않는 workflow_job webhook 헤더 (webhook 전송 클라이언트의 기본 헤더)
+_BASE_WEBHOOK_HEADERS = {
+    "Content-Type": "application/json",
+    "X-GitHub-Event": "workflow_job"
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _sign(secret_bytes: bytes, payload_bytes: bytes) -> str:
+    """동일 payload 재전송 시 HMAC 재계산을 피하기 위한 서명 캐시"""
+    return "sha256=" + hmac.digest(secret_bytes, payload_bytes, "sha256").hex()
+
+
+@pytest.fixture(scope="session")
+def webhook_http_client(app_client, app_url) -> Generator[httpx.Client, None, None]:
+    """Webhook 전송 전용 HTTP 클라이언트 (고정 헤더를 클라이언트 기본값으로 설정)
+    
+    app_client에 의존해 앱 연결 확인이 끝난 뒤에 생성됩니다.
+    """
+    client = httpx.Client(
+        base_url=app_url,
+        timeout=30.0,
+        http2=True,
+        headers=_BASE_WEBHOOK_HEADERS,
+        limits=_HTTP_LIMITS
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def webhook_helper(webhook_http_client, async_app_client, integration_env):
+    """Webhook 전송 헬퍼 (테스트별 상태가 없으므로 세션 공유)"""
     
     class WebhookHelper:
         def __init__(self):
-            self.client = app_client
-            self.secret = integration_env["WEBHOOK_SECRET"]
+            self.client = webhook_http_client
+            self.async_client = async_app_client
+            self.secret = integration_env.webhook_secret
+            self._secret_bytes = integration_env.webhook_secret_bytes
         
-        def send_workflow_job(
+        def _build_workflow_job(
             self,
-            action: str = "queued",
-            job_id: int = 12345,
-            run_id: int = 67890,
-            org_name: str = "test-org",
-            repo_name: str = "test-repo",
-            labels: list = None
-        ) -> httpx.Response:
-            """Workflow Job webhook 전송"""
-            import hashlib
-            import hmac
-            
+            action: str,
+            job_id: int,
+            run_id: int,
+            org_name: str,
+            repo_name: str,
+            labels: list
+        ) -> Tuple[bytes, Dict[str, str]]:
+            """Workflow Job webhook 본문과 서명 헤더 생성"""
             if labels is None:
                 labels = ["code-linux", "integration-test"]
             
@@ -331,22 +648,46 @@ def webhook_helper(app_client, integration_env):
                 }
             }
             
-            payload_bytes = json.dumps(payload).encode()
-            signature = "sha256=" + hmac.new(
-                self.secret.encode(),
-                payload_bytes,
-                hashlib.sha256
-            ).hexdigest()
+            payload_bytes = orjson.dumps(payload)
+            signature = _sign(self._secret_bytes, payload_bytes)
             
-            return self.client.post(
-                "/webhook",
-                content=payload_bytes,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-GitHub-Event": "workflow_job",
-                    "X-GitHub-Delivery": f"test-delivery-{job_id}",
-                    "X-Hub-Signature-256": signature
-                }
+            # Content-Type/X-GitHub-Event는 클라이언트 기본 헤더로 설정됨
+            headers = {
+                "X-GitHub-Delivery": f"test-delivery-{job_id}",
+                "X-Hub-Signature-256": signature
+            }
+            return payload_bytes, headers
+        
+        def send_workflow_job(
+            self,
+            action: str = "queued",
+            job_id: int = 12345,
+            run_id: int = 67890,
+            org_name: str = "test-org",
+            repo_name: str = "test-repo",
+            labels: list = None
+        ) -> httpx.Response:
+            """Workflow Job webhook 전송"""
+            payload_bytes, headers = self._build_workflow_job(
+                action, job_id, run_id, org_name, repo_name, labels
+            )
+            return self.client.post("/webhook", content=payload_bytes, headers=headers)
+        
+        async def send_workflow_job_async(
+            self,
+            action: str = "queued",
+            job_id: int = 12345,
+            run_id: int = 67890,
+            org_name: str = "test-org",
+            repo_name: str = "test-repo",
+            labels: list = None
+        ) -> httpx.Response:
+            """Workflow Job webhook 비동기 전송 (asyncio.gather로 동시 전송용)"""
+            payload_bytes, headers = self._build_workflow_job(
+                action, job_id, run_id, org_name, repo_name, labels
+            )
+            return await self.async_client.post(
+                "/webhook", content=payload_bytes, headers=headers
             )
     
     return WebhookHelper()
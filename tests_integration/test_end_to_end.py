@@ -5,11 +5,40 @@ End-to-End Integration Tests
 Kubernetes 통합은 별도의 테스트에서 수행
 """
 
+import asyncio
+import hmac
 import json
 import time
+from typing import Callable
+
 import pytest
 
 
+def _wait_until(pred: Callable[[], bool], timeout: float = 2.0, tick: float = 0.01) -> bool:
+    """비동기 처리 결과가 관측될 때까지 짧은 간격으로 폴링 (timeout 초과 시 False)"""
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if pred():
+            return True
+        time.sleep(tick)
+    return pred()
+
+
+async def _wait_until_async(
+    pred: Callable[[], bool],
+    timeout: float = 2.0,
+    tick: float = 0.01
+) -> bool:
+    """_wait_until의 async 버전 (폴링 중 이벤트 루프를 막지 않도록 asyncio.sleep 사용)"""
+    loop = asyncio.get_running_loop()
+    end = loop.time() + timeout
+    while loop.time() < end:
+        if pred():
+            return True
+        await asyncio.sleep(tick)
+    return pred()
+
+
 @pytest.mark.integration
 class TestHealthEndpoints:
     """앱 Health 엔드포인트 테스트"""
@@ -41,16 +70,9 @@ class TestWebhookEndpoint:
     
     def test_webhook_ping(self, app_client):
         """Webhook ping 이벤트"""
-        import hashlib
-        import hmac
-        
         secret = "test-webhook-secret"
         payload = json.dumps({"zen": "test"}).encode()
-        signature = "sha256=" + hmac.new(
-            secret.encode(),
-            payload,
-            hashlib.sha256
-        ).hexdigest()
+        signature = "sha256=" + hmac.digest(secret.encode(), payload, "sha256").hex()
         
         response = app_client.post(
             "/webhook",
@@ -190,7 +212,7 @@ class TestAdminOrgLimitsEndpoints:
         """인증으로 Org Limits 조회"""
         response = app_client.get(
             "/admin/org-limits",
-            headers={"X-Admin-Key": integration_env["ADMIN_API_KEY"]}
+            headers={"X-Admin-Key": integration_env.admin_api_key}
         )
         assert response.status_code == 200
         
@@ -203,7 +225,7 @@ class TestAdminOrgLimitsEndpoints:
         """특정 Organization 제한 조회"""
         response = app_client.get(
             "/admin/org-limits/test-org",
-            headers={"X-Admin-Key": integration_env["ADMIN_API_KEY"]}
+            headers={"X-Admin-Key": integration_env.admin_api_key}
         )
         assert response.status_code == 200
         
@@ -218,7 +240,7 @@ class TestAdminOrgLimitsEndpoints:
         """Organization 제한 설정"""
         response = app_client.put(
             "/admin/org-limits/test-org-custom",
-            headers={"X-Admin-Key": integration_env["ADMIN_API_KEY"]},
+            headers={"X-Admin-Key": integration_env.admin_api_key},
             json={"limit": 25}
         )
         assert response.status_code == 200
@@ -233,14 +255,14 @@ class TestAdminOrgLimitsEndpoints:
         # 먼저 설정
         app_client.put(
             "/admin/org-limits/test-org-delete",
-            headers={"X-Admin-Key": integration_env["ADMIN_API_KEY"]},
+            headers={"X-Admin-Key": integration_env.admin_api_key},
             json={"limit": 15}
         )
         
         # 삭제
         response = app_client.delete(
             "/admin/org-limits/test-org-delete",
-            headers={"X-Admin-Key": integration_env["ADMIN_API_KEY"]}
+            headers={"X-Admin-Key": integration_env.admin_api_key}
         )
         assert response.status_code == 200
         
@@ -279,9 +301,6 @@ class TestGitHubApiIntegration:
         clean_github_mock
     ):
         """Webhook 처리 시 GitHub API 호출 확인"""
-        # API 호출 기록 초기화
-        github_mock_client.delete("/test/api-calls")
-        
         # Webhook 전송
         webhook_helper.send_workflow_job(
             action="queued",
@@ -289,8 +308,10 @@ class TestGitHubApiIntegration:
             org_name="test-org"
         )
         
-        # 약간의 대기 (비동기 처리)
-        time.sleep(2)
+        # API 호출이 기록될 때까지 대기 (비동기 처리)
+        _wait_until(
+            lambda: github_mock_client.get("/test/api-calls").json()["total_count"] > 0
+        )
         
         # API 호출 기록 확인
         response = github_mock_client.get("/test/api-calls")
@@ -327,32 +348,38 @@ class TestRedisStateAfterWebhook:
         assert data["status"] == "queued"
         assert data["job_id"] == job_id
         
-        # 약간의 대기
-        time.sleep(1)
+        # pending queue 반영 대기
+        _wait_until(lambda: clean_redis.llen("org:test-org:pending") > 0)
         
         # Job이 pending queue에 추가되었는지 확인
         pending_count = clean_redis.llen("org:test-org:pending")
         # queued 상태면 pending에 추가됨
         assert pending_count >= 0  # 최소한 에러 없이 처리됨
     
-    def test_multiple_queued_jobs(
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_multiple_queued_jobs(
         self,
         webhook_helper,
         clean_redis,
         clean_github_mock
     ):
-        """여러 Job 대기열 테스트"""
+        """여러 Job 대기열 테스트 (webhook 동시 전송)"""
         job_ids = [77771, 77772, 77773]
         
-        for job_id in job_ids:
-            response = webhook_helper.send_workflow_job(
+        responses = await asyncio.gather(*(
+            webhook_helper.send_workflow_job_async(
                 action="queued",
                 job_id=job_id,
                 org_name="test-org"
             )
+            for job_id in job_ids
+        ))
+        for response in responses:
             assert response.status_code == 200
         
-        time.sleep(1)
+        await _wait_until_async(
+            lambda: clean_redis.llen("org:test-org:pending") >= len(job_ids)
+        )
         
         # pending queue에 job들이 추가되었는지 확인
         pending_count = clean_redis.llen("org:test-org:pending")
@@ -4,10 +4,16 @@ GitHub Mock Server Integration Tests
 GitHub Mock API 서버와의 통합 테스트
 """
 
-import base64
-import json
+import asyncio
+
+import orjson
 import pytest
 
+try:
+    from pybase64 import b64decode  # SIMD 가속 디코더
+except ImportError:
+    from base64 import b64decode
+
 
 @pytest.mark.integration
 @pytest.mark.github_mock
@@ -103,23 +109,14 @@ class TestRunnerEndpoints:
         assert "token" in data
         assert data["token"].startswith("AAAAAA")
     
-    def test_generate_jit_config(self, clean_github_mock):
+    def test_generate_jit_config(self, clean_github_mock, default_runner_group_id):
         """JIT Config 생성"""
-        # Runner 그룹 ID 조회
-        groups_response = clean_github_mock.get(
-            "/api/v3/orgs/test-org/actions/runner-groups"
-        )
-        default_group = [
-            g for g in groups_response.json()["runner_groups"] 
-            if g["default"]
-        ][0]
-        
         # JIT Config 생성
         response = clean_github_mock.post(
             "/api/v3/orgs/test-org/actions/runners/generate-jitconfig",
             json={
                 "name": "jit-runner-test-001",
-                "runner_group_id": default_group["id"],
+                "runner_group_id": default_runner_group_id,
                 "labels": ["code-linux", "integration-test"],
                 "work_folder": "_work"
             }
@@ -133,27 +130,18 @@ class TestRunnerEndpoints:
         
         # encoded_jit_config 검증
         assert "encoded_jit_config" in data
-        decoded = json.loads(base64.b64decode(data["encoded_jit_config"]))
+        decoded = orjson.loads(b64decode(data["encoded_jit_config"]))
         assert decoded["runner_name"] == "jit-runner-test-001"
         assert decoded["labels"] == ["code-linux", "integration-test"]
     
-    def test_list_runners_after_create(self, clean_github_mock):
+    def test_list_runners_after_create(self, clean_github_mock, default_runner_group_id):
         """Runner 생성 후 목록 조회"""
-        # Runner 그룹 ID 조회
-        groups_response = clean_github_mock.get(
-            "/api/v3/orgs/test-org/actions/runner-groups"
-        )
-        default_group = [
-            g for g in groups_response.json()["runner_groups"] 
-            if g["default"]
-        ][0]
-        
         # JIT Runner 생성
         clean_github_mock.post(
             "/api/v3/orgs/test-org/actions/runners/generate-jitconfig",
             json={
                 "name": "jit-runner-list-test",
-                "runner_group_id": default_group["id"],
+                "runner_group_id": default_runner_group_id,
                 "labels": ["code-linux"],
                 "work_folder": "_work"
             }
@@ -169,23 +157,14 @@ class TestRunnerEndpoints:
         runner_names = [r["name"] for r in data["runners"]]
         assert "jit-runner-list-test" in runner_names
     
-    def test_delete_runner(self, clean_github_mock):
+    def test_delete_runner(self, clean_github_mock, default_runner_group_id):
         """Runner 삭제"""
-        # Runner 그룹 ID 조회
-        groups_response = clean_github_mock.get(
-            "/api/v3/orgs/test-org/actions/runner-groups"
-        )
-        default_group = [
-            g for g in groups_response.json()["runner_groups"] 
-            if g["default"]
-        ][0]
-        
         # Runner 생성
         create_response = clean_github_mock.post(
             "/api/v3/orgs/test-org/actions/runners/generate-jitconfig",
             json={
                 "name": "jit-runner-delete-test",
-                "runner_group_id": default_group["id"],
+                "runner_group_id": default_runner_group_id,
                 "labels": ["code-linux"],
                 "work_folder": "_work"
             }
@@ -210,14 +189,14 @@ class TestRunnerEndpoints:
 class TestApiCallTracking:
     """API 호출 추적 테스트"""
     
-    def test_api_calls_are_tracked(self, clean_github_mock):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_api_calls_are_tracked(self, clean_github_mock, async_github_mock_client):
         """API 호출이 추적되는지 확인"""
-        # API 호출 기록 초기화
-        clean_github_mock.delete("/test/api-calls")
-        
-        # 몇 가지 API 호출
-        clean_github_mock.get("/api/v3/orgs/test-org")
-        clean_github_mock.get("/api/v3/orgs/test-org/actions/runners")
+        # 서로 독립적인 API 호출은 동시에 전송
+        await asyncio.gather(
+            async_github_mock_client.get("/api/v3/orgs/test-org"),
+            async_github_mock_client.get("/api/v3/orgs/test-org/actions/runners")
+        )
         
         # 호출 기록 확인
         response = clean_github_mock.get("/test/api-calls")
@@ -4,8 +4,183 @@ Kubernetes Integration Tests
 실제 Kubernetes 클러스터(Kind)와의 통합 테스트
 """
 
-import time
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, Dict, Optional
+
+import orjson
 import pytest
+from kubernetes import client, watch
+from kubernetes.client.rest import ApiException
+
+# kind 노드에 미리 적재되는 이미지 (IfNotPresent로 매 Pod마다 레지스트리 확인을 하지 않음)
+_TEST_IMAGE = "busybox:latest"
+
+
+def _wait_for_pod_phase(
+    k8s,
+    namespace: str,
+    name: str,
+    phases: Collection[str],
+    timeout: int = 10
+) -> Optional[str]:
+    """Pod phase가 phases 중 하나가 될 때까지 watch로 대기 (timeout 시 None)"""
+    w = watch.Watch()
+    for event in w.stream(
+        k8s.list_namespaced_pod,
+        namespace=namespace,
+        field_selector=f"metadata.name={name}",
+        timeout_seconds=timeout
+    ):
+        phase = event["object"].status.phase
+        if phase in phases:
+            w.stop()
+            return phase
+    return None
+
+
+def _wait_for_pod_deleted(k8s, namespace: str, name: str, timeout: int = 10) -> bool:
+    """Pod가 삭제될 때까지 watch로 대기 (이미 없으면 즉시 True)"""
+    field_selector = f"metadata.name={name}"
+    pods = k8s.list_namespaced_pod(namespace=namespace, field_selector=field_selector)
+    if not pods.items:
+        return True
+    
+    w = watch.Watch()
+    for event in w.stream(
+        k8s.list_namespaced_pod,
+        namespace=namespace,
+        field_selector=field_selector,
+        resource_version=pods.metadata.resource_version,
+        timeout_seconds=timeout
+    ):
+        if event["type"] == "DELETED":
+            w.stop()
+            return True
+    return False
+
+
+def _build_pod(
+    name: str,
+    labels: Dict[str, str],
+    annotations: Optional[Dict[str, str]] = None,
+    with_volumes: bool = False
+) -> client.V1Pod:
+    """테스트용 Pod 정의 생성 (with_volumes 시 Runner Pod와 같은 work 볼륨 포함)"""
+    volume_mounts = None
+    volumes = None
+    if with_volumes:
+        volume_mounts = [
+            client.V1VolumeMount(
+                name="work",
+                mount_path="/home/runner/_work"
+            )
+        ]
+        volumes = [
+            client.V1Volume(
+                name="work",
+                empty_dir=client.V1EmptyDirVolumeSource()
+            )
+        ]
+    
+    return client.V1Pod(
+        api_version="v1",
+        kind="Pod",
+        metadata=client.V1ObjectMeta(
+            name=name,
+            labels=labels,
+            annotations=annotations
+        ),
+        spec=client.V1PodSpec(
+            restart_policy="Never",
+            containers=[
+                client.V1Container(
+                    name="runner",
+                    image=_TEST_IMAGE,
+                    image_pull_policy="IfNotPresent",
+                    command=["sh", "-c", "echo 'test' && sleep 30"],
+                    resources=client.V1ResourceRequirements(
+                        requests={"cpu": "50m", "memory": "64Mi"},
+                        limits={"cpu": "100m", "memory": "128Mi"}
+                    ),
+                    volume_mounts=volume_mounts
+                )
+            ],
+            volumes=volumes
+        )
+    )
+
+
+def _simple_pod(name: str) -> client.V1Pod:
+    """기본 라벨만 가진 단순 Pod"""
+    return _build_pod(name, {"app": "integration-test", "test": "true"})
+
+
+def _runner_pod(name: str) -> client.V1Pod:
+    """Runner Pod 구조 Pod (runner-name 라벨은 Pod 이름과 동일, DinD 없는 단순 버전)"""
+    return _build_pod(
+        name,
+        labels={
+            "app": "jit-runner",
+            "org": "test-org",
+            "job-id": "12345",
+            "runner-name": name
+        },
+        annotations={
+            "jit-runner-manager/created-by": "jit-runner-manager",
+            "jit-runner-manager/org": "test-org",
+            "jit-runner-manager/job-id": "12345"
+        },
+        with_volumes=True
+    )
+
+
+def _verify_phase(k8s, namespace: str, pod: client.V1Pod) -> None:
+    """Pod 상태 확인 (Pending 또는 Running, watch 이벤트의 phase를 그대로 사용)"""
+    phase = _wait_for_pod_phase(
+        k8s,
+        namespace,
+        pod.metadata.name,
+        ("Pending", "Running", "Succeeded"),
+        timeout=5
+    )
+    assert phase in ["Pending", "Running", "Succeeded"]
+
+
+def _verify_delete(k8s, namespace: str, pod: client.V1Pod) -> None:
+    """Pod 삭제 후 404 또는 Terminating 상태 확인"""
+    name = pod.metadata.name
+    assert k8s.read_namespaced_pod(name=name, namespace=namespace) is not None
+    
+    k8s.delete_namespaced_pod(
+        name=name,
+        namespace=namespace,
+        body=client.V1DeleteOptions(grace_period_seconds=0)
+    )
+    
+    # 삭제 확인 (DELETED 이벤트 수신 또는 timeout까지 대기)
+    _wait_for_pod_deleted(k8s, namespace, name)
+    try:
+        k8s.read_namespaced_pod(name=name, namespace=namespace)
+        # Pod가 아직 Terminating 상태일 수 있음
+    except ApiException as e:
+        # 404면 정상적으로 삭제됨
+        assert e.status == 404
+
+
+def _verify_structure(k8s, namespace: str, pod: client.V1Pod) -> None:
+    """Runner Pod 라벨/어노테이션/컨테이너/볼륨 구조 확인"""
+    assert pod.metadata.labels["app"] == "jit-runner"
+    assert pod.metadata.labels["org"] == "test-org"
+    assert pod.metadata.annotations["jit-runner-manager/created-by"] == "jit-runner-manager"
+    
+    # 컨테이너 검증
+    assert len(pod.spec.containers) == 1
+    assert pod.spec.containers[0].name == "runner"
+    
+    # 볼륨 검증
+    volume_names = [v.name for v in pod.spec.volumes]
+    assert "work" in volume_names
 
 
 @pytest.mark.integration
@@ -21,15 +196,13 @@ class TestKubernetesConnection:
     
     def test_namespace_exists(self, k8s_client, integration_env):
         """jit-runners 네임스페이스 존재 확인"""
-        namespace = integration_env["RUNNER_NAMESPACE"]
+        namespace = integration_env.runner_namespace
         
         try:
             ns = k8s_client.read_namespace(name=namespace)
             assert ns.metadata.name == namespace
         except Exception:
             # 네임스페이스 생성
-            from kubernetes import client
-            
             ns_body = client.V1Namespace(
                 metadata=client.V1ObjectMeta(name=namespace)
             )
@@ -44,76 +217,31 @@ class TestKubernetesConnection:
 class TestPodOperations:
     """Pod 작업 테스트"""
     
-    def test_create_simple_pod(self, k8s_client, clean_k8s_namespace, integration_env):
-        """간단한 Pod 생성 테스트"""
-        from kubernetes import client
-        
-        namespace = integration_env["RUNNER_NAMESPACE"]
-        pod_name = "integration-test-pod"
+    @pytest.mark.parametrize(
+        "build, verify",
+        [
+            pytest.param(_simple_pod, _verify_phase, id="simple"),
+            pytest.param(_simple_pod, _verify_delete, id="delete"),
+            pytest.param(_runner_pod, _verify_structure, id="runner-structure"),
+        ]
+    )
+    def test_pod_lifecycle(self, k8s_client, clean_k8s_namespace, created_pod_factory, build, verify):
+        """Pod 생성 후 시나리오별 검증 (정리는 테스트 namespace 삭제로 처리)"""
+        pod_name = f"test-pod-{secrets.token_hex(4)}"
         
-        # Pod 정의
-        pod = client.V1Pod(
-            api_version="v1",
-            kind="Pod",
-            metadata=client.V1ObjectMeta(
-                name=pod_name,
-                labels={
-                    "app": "integration-test",
-                    "test": "true"
-                }
-            ),
-            spec=client.V1PodSpec(
-                restart_policy="Never",
-                containers=[
-                    client.V1Container(
-                        name="test-container",
-                        image="busybox:latest",
-                        command=["sh", "-c", "echo 'test' && sleep 30"],
-                        resources=client.V1ResourceRequirements(
-                            requests={"cpu": "50m", "memory": "64Mi"},
-                            limits={"cpu": "100m", "memory": "128Mi"}
-                        )
-                    )
-                ]
-            )
-        )
+        created_pod = created_pod_factory(build(pod_name))
+        assert created_pod.metadata.name == pod_name
         
-        try:
-            # Pod 생성
-            created_pod = k8s_client.create_namespaced_pod(
-                namespace=namespace,
-                body=pod
-            )
-            assert created_pod.metadata.name == pod_name
-            
-            # Pod 상태 확인 (Pending 또는 Running)
-            time.sleep(2)
-            pod_status = k8s_client.read_namespaced_pod_status(
-                name=pod_name,
-                namespace=namespace
-            )
-            assert pod_status.status.phase in ["Pending", "Running", "Succeeded"]
-            
-        finally:
-            # 정리
-            try:
-                k8s_client.delete_namespaced_pod(
-                    name=pod_name,
-                    namespace=namespace
-                )
-            except Exception:
-                pass
+        verify(k8s_client, clean_k8s_namespace, created_pod)
     
-    def test_list_pods_with_label_selector(self, k8s_client, clean_k8s_namespace, integration_env):
+    def test_list_pods_with_label_selector(self, k8s_client, clean_k8s_namespace):
         """Label selector로 Pod 목록 조회"""
-        from kubernetes import client
+        namespace = clean_k8s_namespace
         
-        namespace = integration_env["RUNNER_NAMESPACE"]
-        
-        # 테스트 Pod 생성
+        # 테스트 Pod 생성 (apiserver 왕복을 겹치도록 병렬 생성)
         pod_names = ["test-pod-1", "test-pod-2"]
-        for pod_name in pod_names:
-            pod = client.V1Pod(
+        pod_bodies = [
+            client.V1Pod(
                 api_version="v1",
                 kind="Pod",
                 metadata=client.V1ObjectMeta(
@@ -129,174 +257,29 @@ class TestPodOperations:
                     containers=[
                         client.V1Container(
                             name="test-container",
-                            image="busybox:latest",
+                            image=_TEST_IMAGE,
+                            image_pull_policy="IfNotPresent",
                             command=["sleep", "60"]
                         )
                     ]
                 )
             )
-            k8s_client.create_namespaced_pod(namespace=namespace, body=pod)
+            for pod_name in pod_names
+        ]
+        with ThreadPoolExecutor(max_workers=len(pod_bodies)) as executor:
+            list(executor.map(
+                lambda pod: k8s_client.create_namespaced_pod(namespace=namespace, body=pod),
+                pod_bodies
+            ))
         
-        try:
-            # Label selector로 조회
-            pods = k8s_client.list_namespaced_pod(
-                namespace=namespace,
-                label_selector="app=jit-runner,org=test-org"
-            )
-            
-            found_names = [p.metadata.name for p in pods.items]
-            for pod_name in pod_names:
-                assert pod_name in found_names
-            
-        finally:
-            # 정리
-            for pod_name in pod_names:
-                try:
-                    k8s_client.delete_namespaced_pod(
-                        name=pod_name,
-                        namespace=namespace
-                    )
-                except Exception:
-                    pass
-    
-    def test_delete_pod(self, k8s_client, clean_k8s_namespace, integration_env):
-        """Pod 삭제 테스트"""
-        from kubernetes import client
-        from kubernetes.client.rest import ApiException
-        
-        namespace = integration_env["RUNNER_NAMESPACE"]
-        pod_name = "test-delete-pod"
-        
-        # Pod 생성
-        pod = client.V1Pod(
-            api_version="v1",
-            kind="Pod",
-            metadata=client.V1ObjectMeta(
-                name=pod_name,
-                labels={"app": "jit-runner"}
-            ),
-            spec=client.V1PodSpec(
-                restart_policy="Never",
-                containers=[
-                    client.V1Container(
-                        name="test-container",
-                        image="busybox:latest",
-                        command=["sleep", "60"]
-                    )
-                ]
-            )
-        )
-        k8s_client.create_namespaced_pod(namespace=namespace, body=pod)
-        
-        # Pod 존재 확인
-        pod_exists = k8s_client.read_namespaced_pod(
-            name=pod_name,
-            namespace=namespace
-        )
-        assert pod_exists is not None
-        
-        # Pod 삭제
-        k8s_client.delete_namespaced_pod(
-            name=pod_name,
+        # Label selector로 조회 (모델 객체 변환 없이 원본 JSON을 바로 파싱)
+        response = k8s_client.list_namespaced_pod(
             namespace=namespace,
-            body=client.V1DeleteOptions(grace_period_seconds=0)
+            label_selector="app=jit-runner,org=test-org",
+            _preload_content=False
         )
+        pods = orjson.loads(response.data)
         
-        # 삭제 확인 (약간의 대기 후)
-        time.sleep(2)
-        try:
-            k8s_client.read_namespaced_pod(
-                name=pod_name,
-                namespace=namespace
-            )
-            # Pod가 아직 Terminating 상태일 수 있음
-        except ApiException as e:
-            # 404면 정상적으로 삭제됨
-            assert e.status == 404
-
-
-@pytest.mark.integration
-@pytest.mark.kubernetes
-class TestRunnerPodTemplate:
-    """Runner Pod 템플릿 테스트"""
-    
-    def test_runner_pod_structure(self, k8s_client, clean_k8s_namespace, integration_env):
-        """Runner Pod 구조 테스트 (DinD 없는 단순 버전)"""
-        from kubernetes import client
-        
-        namespace = integration_env["RUNNER_NAMESPACE"]
-        runner_name = "test-runner-structure"
-        
-        # 실제 Runner Pod 구조와 유사한 Pod 생성
-        pod = client.V1Pod(
-            api_version="v1",
-            kind="Pod",
-            metadata=client.V1ObjectMeta(
-                name=runner_name,
-                labels={
-                    "app": "jit-runner",
-                    "org": "test-org",
-                    "job-id": "12345",
-                    "runner-name": runner_name
-                },
-                annotations={
-                    "jit-runner-manager/created-by": "jit-runner-manager",
-                    "jit-runner-manager/org": "test-org",
-                    "jit-runner-manager/job-id": "12345"
-                }
-            ),
-            spec=client.V1PodSpec(
-                restart_policy="Never",
-                containers=[
-                    client.V1Container(
-                        name="runner",
-                        image="busybox:latest",
-                        command=["sh", "-c", "echo 'Mock runner' && sleep 30"],
-                        resources=client.V1ResourceRequirements(
-                            requests={"cpu": "100m", "memory": "128Mi"},
-                            limits={"cpu": "500m", "memory": "512Mi"}
-                        ),
-                        volume_mounts=[
-                            client.V1VolumeMount(
-                                name="work",
-                                mount_path="/home/runner/_work"
-                            )
-                        ]
-                    )
-                ],
-                volumes=[
-                    client.V1Volume(
-                        name="work",
-                        empty_dir=client.V1EmptyDirVolumeSource()
-                    )
-                ]
-            )
-        )
-        
-        try:
-            created_pod = k8s_client.create_namespaced_pod(
-                namespace=namespace,
-                body=pod
-            )
-            
-            # 구조 검증
-            assert created_pod.metadata.labels["app"] == "jit-runner"
-            assert created_pod.metadata.labels["org"] == "test-org"
-            assert created_pod.metadata.annotations["jit-runner-manager/created-by"] == "jit-runner-manager"
-            
-            # 컨테이너 검증
-            assert len(created_pod.spec.containers) == 1
-            assert created_pod.spec.containers[0].name == "runner"
-            
-            # 볼륨 검증
-            volume_names = [v.name for v in created_pod.spec.volumes]
-            assert "work" in volume_names
-            
-        finally:
-            try:
-                k8s_client.delete_namespaced_pod(
-                    name=runner_name,
-                    namespace=namespace
-                )
-            except Exception:
-                pass
+        found_names = [p["metadata"]["name"] for p in pods["items"]]
+        for pod_name in pod_names:
+            assert pod_name in found_names
@@ -4,8 +4,12 @@ Redis Integration Tests
 실제 Redis 서버와의 통합 테스트
 """
 
-import json
+import time
+
+import orjson
 import pytest
+from redis.connection import DefaultParser
+from redis.utils import HIREDIS_AVAILABLE
 
 
 @pytest.mark.integration
@@ -17,6 +21,16 @@ class TestRedisIntegration:
         """Redis 연결 테스트"""
         assert redis_client.ping() is True
     
+    def test_redis_uses_hiredis_parser(self, redis_client):
+        """hiredis C 파서 사용 확인 (redis[hiredis] 설치 시 redis-py가 자동 선택)"""
+        pytest.importorskip("hiredis", reason="hiredis가 설치되어 있지 않습니다.")
+        
+        assert HIREDIS_AVAILABLE
+        assert "Hiredis" in DefaultParser.__name__
+        # parser_class를 직접 지정하지 않아야 연결마다 DefaultParser가 사용됨
+        assert "parser_class" not in redis_client.connection_pool.connection_kwargs
+        assert redis_client.ping() is True
+    
     def test_redis_set_get(self, clean_redis):
         """기본 SET/GET 동작 테스트"""
         clean_redis.set("test:key", "test-value")
@@ -55,11 +69,13 @@ class TestRedisIntegration:
     
     def test_redis_expiration(self, clean_redis):
         """Key 만료 테스트"""
-        clean_redis.set("test:expire", "value", ex=1)
+        clean_redis.set("test:expire", "value", px=200)
         assert clean_redis.get("test:expire") == "value"
         
-        import time
-        time.sleep(2)
+        # 만료될 때까지 10ms 간격으로 확인 (최대 2초)
+        deadline = time.monotonic() + 2.0
+        while clean_redis.exists("test:expire") and time.monotonic() < deadline:
+            time.sleep(0.01)
         assert clean_redis.get("test:expire") is None
 
 
@@ -80,10 +96,12 @@ class TestRunnerStateManagement:
         clean_redis.incr(key)
         assert clean_redis.get(key) == "1"
         
-        # 추가 Runner
-        clean_redis.incr(key)
-        clean_redis.incr(key)
-        assert clean_redis.get(key) == "3"
+        # 추가 Runner (증가와 조회를 한 번의 왕복으로)
+        with clean_redis.pipeline(transaction=False) as pipe:
+            pipe.incr(key)
+            pipe.incr(key)
+            pipe.get(key)
+            assert pipe.execute()[-1] == "3"
         
         # Runner 완료 시 감소
         clean_redis.decr(key)
@@ -101,15 +119,19 @@ class TestRunnerStateManagement:
             {"job_id": 3, "labels": ["code-linux"]}
         ]
         
-        for job in jobs:
-            clean_redis.rpush(key, json.dumps(job))
+        clean_redis.rpush(key, *(orjson.dumps(job) for job in jobs))
         
         assert clean_redis.llen(key) == 3
         
         # FIFO로 처리
-        first_job = json.loads(clean_redis.lpop(key))
+        first_job = orjson.loads(clean_redis.lpop(key))
         assert first_job["job_id"] == 1
         assert clean_redis.llen(key) == 2
+        
+        # 남은 Job은 LPOP count로 한 번에 꺼냄 (Redis 6.2+)
+        remaining = [orjson.loads(item) for item in clean_redis.lpop(key, count=2)]
+        assert [job["job_id"] for job in remaining] == [2, 3]
+        assert clean_redis.llen(key) == 0
     
     def test_runner_info_storage(self, clean_redis):
         """Runner 정보 저장 테스트"""
@@ -125,16 +147,22 @@ class TestRunnerStateManagement:
         }
         
         # 정보 저장
-        for field, value in runner_info.items():
-            clean_redis.hset(key, field, value)
-        
-        # 정보 조회
-        stored_info = clean_redis.hgetall(key)
-        assert stored_info == runner_info
-        
-        # 상태 업데이트
-        clean_redis.hset(key, "status", "completed")
-        assert clean_redis.hget(key, "status") == "completed"
+        clean_redis.hset(key, mapping=runner_info)
+        
+        # 정보 조회 (필드 수와 값을 한 번의 왕복으로 확인)
+        with clean_redis.pipeline(transaction=False) as pipe:
+            pipe.hlen(key)
+            pipe.hmget(key, list(runner_info))
+            field_count, values = pipe.execute()
+        assert field_count == len(runner_info)
+        assert values == list(runner_info.values())
+        
+        # 상태 업데이트 (갱신과 확인을 한 번의 왕복으로)
+        with clean_redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, "status", "completed")
+            pipe.hget(key, "status")
+            _, status = pipe.execute()
+        assert status == "completed"
     
     def test_global_total_runners(self, clean_redis):
         """전역 Runner 수 관리 테스트"""
@@ -143,13 +171,16 @@ class TestRunnerStateManagement:
         clean_redis.set(key, "0")
         
         # 여러 org에서 Runner 생성
-        clean_redis.incr(key)  # org1
-        clean_redis.incr(key)  # org1
-        clean_redis.incr(key)  # org2
+        with clean_redis.pipeline(transaction=False) as pipe:
+            pipe.incr(key)  # org1
+            pipe.incr(key)  # org1
+            pipe.incr(key)  # org2
+            pipe.get(key)
+            stored = pipe.execute()[-1]
         
-        assert clean_redis.get(key) == "3"
+        assert stored == "3"
         
         # 최대 제한 체크 시뮬레이션
-        current = int(clean_redis.get(key))
+        current = int(stored)
         max_total = 50
         assert current < max_total
@@ -0,0 +1,52 @@
+"""
+xdist Group Tests
+
+conftest의 xdist_group 마커가 pytest-xdist의 node ID 접미사(@group)에 반영되는지 확인
+(외부 서비스 없이 실행되며, 대상 테스트는 --integration 없이 모두 스킵됨)
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("xdist", reason="pytest-xdist가 설치되어 있지 않습니다.")
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 그룹 -> 해당 그룹으로 묶여야 하는 테스트 파일
+_GROUPED_FILES = {
+    "shared_services": (
+        "tests_integration/test_redis_integration.py",
+        "tests_integration/test_github_mock_integration.py",
+    ),
+    "kubernetes": ("tests_integration/test_kubernetes_integration.py",),
+}
+
+
+def test_loadgroup_node_ids_carry_group_suffix():
+    """-n 2 --dist loadgroup 실행 시 그룹 대상 테스트의 node ID에 @group 접미사가 붙음"""
+    files = [path for paths in _GROUPED_FILES.values() for path in paths]
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "pytest", *files,
+            "-n", "2", "--dist", "loadgroup", "-v", "-p", "no:cacheprovider",
+        ],
+        cwd=_PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=300
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    # "[gw0] [  5%] SKIPPED tests_integration/...::test_x@group" 형태의 결과 줄
+    node_ids = re.findall(r"^\[gw\d+\] \[\s*\d+%\] \w+ (\S+)", result.stdout, re.MULTILINE)
+    assert node_ids, result.stdout
+
+    for group, paths in _GROUPED_FILES.items():
+        grouped = [node_id for node_id in node_ids if node_id.startswith(paths)]
+        assert grouped, f"{group} 그룹 대상 테스트가 실행되지 않았습니다."
+        for node_id in grouped:
+            assert node_id.endswith(f"@{group}"), node_id